@@ -15,16 +15,15 @@ class UserProfileInline(admin.StackedInline):
 class UserAdmin(BaseUserAdmin):
     inlines = (UserProfileInline,)
     list_display = ('username', 'email', 'first_name', 'last_name', 'is_staff', 'get_can_create_content', 'get_phone_number')
+    list_select_related = ('profile',)
     
     def get_can_create_content(self, obj):
-        profile, created = UserProfile.objects.get_or_create(user=obj)
-        return profile.can_create_content
+        return UserProfile.for_user(obj).can_create_content
     get_can_create_content.short_description = 'Can Create Content'
     get_can_create_content.boolean = True
     
     def get_phone_number(self, obj):
-        profile, created = UserProfile.objects.get_or_create(user=obj)
-        return profile.phone_number or '-'
+        return UserProfile.for_user(obj).phone_number or '-'
     get_phone_number.short_description = 'Phone Number'
 
 # Re-register UserAdmin
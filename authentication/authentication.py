@@ -0,0 +1,74 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .models import UserProfile, user_cache_key
+
+
+def _cache_fields(model, exclude=()):
+    return [field.attname for field in model._meta.concrete_fields if field.attname not in exclude]
+
+
+# The password hash never goes into the cache; a cached user loads it on access
+USER_CACHE_FIELDS = _cache_fields(User, exclude=('password',))
+PROFILE_CACHE_FIELDS = _cache_fields(UserProfile)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that resolves the user and their profile once and keeps
+    them in the cache for AUTH_USER_CACHE_TIMEOUT seconds.
+
+    The entry is dropped whenever the User or UserProfile is saved or deleted
+    (see authentication.models), but only in the cache the save ran against.
+    Caching is therefore off (a timeout of 0) unless the cache is shared by
+    every worker; see AUTH_USER_CACHE_TIMEOUT in settings.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        timeout = getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 0)
+        key = user_cache_key(user_id)
+        entry = cache.get(key) if timeout else None
+        if entry is None:
+            try:
+                user = self.user_model.objects.select_related('profile').get(
+                    **{api_settings.USER_ID_FIELD: user_id}
+                )
+            except self.user_model.DoesNotExist:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            # Load (or create) the profile now so it is cached with the user
+            profile = UserProfile.for_user(user)
+            password_hash = get_md5_hash_password(user.password)
+            if timeout:
+                cache.set(key, {
+                    'user': [getattr(user, name) for name in USER_CACHE_FIELDS],
+                    'profile': [getattr(profile, name) for name in PROFILE_CACHE_FIELDS],
+                    'password_hash': password_hash,
+                }, timeout)
+        else:
+            db = router.db_for_read(self.user_model)
+            user = self.user_model.from_db(db, USER_CACHE_FIELDS, entry['user'])
+            user.profile = UserProfile.from_db(db, PROFILE_CACHE_FIELDS, entry['profile'])
+            password_hash = entry['password_hash']
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != password_hash:
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
@@ -0,0 +1,178 @@
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from authentication.models import UserProfile
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y'}
+
+
+def _init_worker():
+    # Spawned (non-forked) workers need Django configured before hashing
+    import django
+    from django.apps import apps
+    if not apps.ready:
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+        django.setup()
+
+
+def _hash_password(password):
+    # Blank passwords get an unusable hash, like User.set_unusable_password()
+    return make_password(password or None)
+
+
+# Input columns checked against the model fields they are written to
+VALIDATED_FIELDS = [
+    (User, 'username'),
+    (User, 'email'),
+    (User, 'first_name'),
+    (User, 'last_name'),
+    (UserProfile, 'phone_number'),
+]
+
+
+def read_rows(path, file_format):
+    """Yield (line number, row, error) per member in a CSV (with header) or NDJSON file"""
+    with open(path, newline='', encoding='utf-8') as handle:
+        if file_format == 'csv':
+            reader = csv.DictReader(handle)
+            for row in reader:
+                yield reader.line_num, row, None
+        else:
+            for number, line in enumerate(handle, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield number, json.loads(line), None
+                except ValueError as e:
+                    yield number, None, f'invalid JSON ({e})'
+
+
+def clean_row(row):
+    """
+    Validate a row with the model fields' own validators, so every row that
+    passes can be inserted. Returns (member, None) or (None, error).
+    """
+    if not isinstance(row, dict):
+        return None, 'not an object'
+    member = {}
+    for model, name in VALIDATED_FIELDS:
+        value = row.get(name)
+        if value is None:
+            value = ''
+        if not isinstance(value, str):
+            return None, f'{name} must be a string'
+        field = model._meta.get_field(name)
+        value = value.strip()
+        try:
+            member[name] = field.clean(value or (None if field.null else ''), None)
+        except ValidationError as e:
+            return None, f'{name}: {" ".join(e.messages)}'
+
+    password = row.get('password')
+    if password is not None and not isinstance(password, str):
+        return None, 'password must be a string'
+    member['password'] = password
+    member['can_create_content'] = str(row.get('can_create_content', '')).strip().lower() in TRUE_VALUES
+    return member, None
+
+
+class Command(BaseCommand):
+    help = (
+        'Import members from a CSV or NDJSON file with username, email, password, '
+        'first_name, last_name, phone_number and can_create_content columns. Invalid '
+        'rows are reported and skipped.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or NDJSON file to import')
+        parser.add_argument('--format', choices=['csv', 'ndjson'], help='Defaults to the file extension')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Users inserted per transaction')
+        parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Password hashing processes')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not os.path.exists(path):
+            raise CommandError(f'File not found: {path}')
+        file_format = options['format'] or ('csv' if path.lower().endswith('.csv') else 'ndjson')
+        batch_size = options['batch_size']
+
+        rows = read_rows(path, file_format)
+        seen = set()
+        created = skipped = invalid = 0
+
+        with ProcessPoolExecutor(max_workers=options['workers'], initializer=_init_worker) as pool:
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+
+                members = []
+                for line, row, error in batch:
+                    member, error = (None, error) if error else clean_row(row)
+                    if error:
+                        invalid += 1
+                        self.stderr.write(f'Line {line}: {error}; skipped')
+                        continue
+                    if member['username'] in seen:
+                        skipped += 1
+                        continue
+                    seen.add(member['username'])
+                    members.append(member)
+
+                existing = set(
+                    User.objects.filter(username__in=[member['username'] for member in members])
+                    .values_list('username', flat=True)
+                )
+                skipped += len(existing)
+                members = [member for member in members if member['username'] not in existing]
+                if not members:
+                    continue
+
+                # PBKDF2 dominates the import, so hash the batch across processes
+                hashes = pool.map(
+                    _hash_password,
+                    [member['password'] for member in members],
+                    chunksize=max(1, len(members) // (4 * (options['workers'] or 1))),
+                )
+                users = [
+                    User(
+                        username=member['username'],
+                        email=member['email'],
+                        first_name=member['first_name'],
+                        last_name=member['last_name'],
+                        password=password,
+                    )
+                    for member, password in zip(members, hashes)
+                ]
+
+                # bulk_create skips the post_save receivers, so profiles are inserted here too
+                with transaction.atomic():
+                    User.objects.bulk_create(users)
+                    user_ids = dict(
+                        User.objects.filter(username__in=[user.username for user in users])
+                        .values_list('username', 'id')
+                    )
+                    UserProfile.objects.bulk_create([
+                        UserProfile(
+                            user_id=user_ids[member['username']],
+                            phone_number=member['phone_number'],
+                            can_create_content=member['can_create_content'],
+                        )
+                        for member in members
+                    ])
+
+                created += len(users)
+                self.stdout.write(f'Imported {created} users...')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {created} users, skipped {skipped} existing or duplicate and {invalid} invalid'
+        ))
@@ -1,8 +1,20 @@
 from django.db import models
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+def user_cache_key(user_id):
+    """Cache key of a user resolved by CachedJWTAuthentication"""
+    return f'auth:user:{user_id}'
+
+class UserProfileQuerySet(models.QuerySet):
+    def create_missing(self, users=None):
+        """Create profiles for users that lack one with a single bulk INSERT"""
+        users = User.objects.all() if users is None else users
+        missing = users.filter(profile__isnull=True).values_list('pk', flat=True)
+        return self.bulk_create([UserProfile(user_id=pk) for pk in missing], ignore_conflicts=True)
+
 class UserProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
     can_create_content = models.BooleanField(default=False)
@@ -18,6 +30,11 @@ class UserProfile(models.Model):
         help_text="URL of the user's avatar image"
     )
 
+    objects = UserProfileQuerySet.as_manager()
+
+    # Fields whose changes decide whether save() needs to write
+    TRACKED_FIELDS = ('can_create_content', 'phone_number', 'avatar_url')
+
     def __str__(self):
         return f"{self.user.username} Profile"
 
@@ -29,14 +46,65 @@ class UserProfile(models.Model):
         """Get phone number or return None"""
         return self.phone_number if self.phone_number else None
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_saved_state()
+        return instance
+
+    def _remember_saved_state(self):
+        self._saved_state = {name: self.__dict__[name] for name in self.TRACKED_FIELDS if name in self.__dict__}
+
+    def get_changed_fields(self):
+        """Tracked fields that differ from what was loaded from or last saved to the database"""
+        saved = getattr(self, '_saved_state', None)
+        if saved is None:
+            return list(self.TRACKED_FIELDS)
+        return [
+            name for name in self.TRACKED_FIELDS
+            if name in saved and name in self.__dict__ and self.__dict__[name] != saved[name]
+        ]
+
+    def save(self, *args, **kwargs):
+        # For a row we loaded, write only the changed fields, or nothing at all
+        if getattr(self, '_saved_state', None) is not None and not (
+            kwargs.get('update_fields') or kwargs.get('force_insert')
+        ):
+            changed = self.get_changed_fields()
+            if not changed:
+                return
+            kwargs['update_fields'] = changed
+        super().save(*args, **kwargs)
+        self._remember_saved_state()
+
+    @classmethod
+    def for_user(cls, user):
+        """Return the user's profile, reusing a select_related one and creating it if missing"""
+        try:
+            return user.profile
+        except cls.DoesNotExist:
+            profile, created = cls.objects.get_or_create(user=user)
+            user.profile = profile
+            return profile
+
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
         UserProfile.objects.create(user=instance)
 
 @receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    if hasattr(instance, 'profile'):
-        instance.profile.save()
-    else:
-        UserProfile.objects.create(user=instance)
\ No newline at end of file
+def save_user_profile(sender, instance, created, **kwargs):
+    # Only persist a profile that was loaded and edited through the user; a
+    # missing one is created lazily by UserProfile.for_user, not on every save
+    if created:
+        return
+    profile = User.profile.related.get_cached_value(instance, None)
+    if profile is not None:
+        profile.save()
+
+@receiver([post_save, post_delete], sender=User)
+@receiver([post_save, post_delete], sender=UserProfile)
+def invalidate_cached_user(sender, instance, **kwargs):
+    # Drop the user cached by CachedJWTAuthentication
+    user_id = instance.pk if sender is User else instance.user_id
+    cache.delete(user_cache_key(user_id))
@@ -22,10 +22,11 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         validated_data.pop('password_confirm')
         user = User.objects.create_user(**validated_data)
         
-        # Update the user's profile with phone number
-        profile, created = UserProfile.objects.get_or_create(user=user)
-        profile.phone_number = phone_number
-        profile.save()
+        # The profile was created by the post_save receiver; only write again for a phone number
+        if phone_number:
+            profile = UserProfile.for_user(user)
+            profile.phone_number = phone_number
+            profile.save()
         
         return user
 
@@ -45,6 +46,11 @@ class UserLoginSerializer(serializers.Serializer):
         return attrs
 
 class UserSerializer(serializers.ModelSerializer):
+    """
+    Profile fields are read from ``user.profile``. When serializing many users,
+    pass ``User.objects.select_related('profile')`` after
+    ``UserProfile.objects.create_missing()`` so no per-user queries run.
+    """
     can_create_content = serializers.SerializerMethodField()
     avatar_url = serializers.SerializerMethodField()
     phone_number = serializers.SerializerMethodField()
@@ -55,13 +61,10 @@ class UserSerializer(serializers.ModelSerializer):
                  'is_superuser', 'date_joined', 'can_create_content', 'avatar_url', 'phone_number')
     
     def get_can_create_content(self, obj):
-        profile, created = UserProfile.objects.get_or_create(user=obj)
-        return profile.can_create_content
+        return UserProfile.for_user(obj).can_create_content
     
     def get_avatar_url(self, obj):
-        profile, created = UserProfile.objects.get_or_create(user=obj)
-        return profile.get_avatar_url()
+        return UserProfile.for_user(obj).get_avatar_url()
     
     def get_phone_number(self, obj):
-        profile, created = UserProfile.objects.get_or_create(user=obj)
-        return profile.get_phone_number()
\ No newline at end of file
+        return UserProfile.for_user(obj).get_phone_number()
\ No newline at end of file
@@ -0,0 +1,33 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from authentication.models import UserProfile
+
+
+class AdminUsersListTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user('admin', password='x', is_staff=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        for index in range(10):
+            user = User.objects.create_user(f'member{index}', password='x')
+            UserProfile.objects.filter(user=user).update(can_create_content=index % 2 == 0, phone_number=f'555{index}')
+
+    def test_profiles_are_loaded_with_the_users(self):
+        # Looking for users without a profile, then the users joined to their profiles
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/auth/admin/users/')
+        data = {user['username']: user for user in response.json()}
+        self.assertEqual(len(data), 11)
+        self.assertTrue(data['member0']['can_create_content'])
+        self.assertFalse(data['member1']['can_create_content'])
+        self.assertEqual(data['member3']['phone_number'], '5553')
+
+    def test_missing_profiles_are_created_in_bulk(self):
+        UserProfile.objects.filter(user__username__startswith='member').delete()
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/auth/admin/users/')
+        self.assertEqual(len(response.json()), 11)
+        self.assertEqual(UserProfile.objects.count(), 11)
+        self.assertFalse(response.json()[-1]['can_create_content'])
@@ -0,0 +1,59 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+
+from authentication.models import UserProfile
+
+
+class ImportUsersTests(TestCase):
+    def import_file(self, suffix, content):
+        handle, path = tempfile.mkstemp(suffix=suffix)
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, 'w', encoding='utf-8') as file:
+            file.write(content)
+        stdout, stderr = StringIO(), StringIO()
+        call_command('import_users', path, workers=1, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_csv_rows_become_users_with_profiles(self):
+        User.objects.create_user('existing', password='x')
+        stdout, stderr = self.import_file('.csv', '\n'.join([
+            'username,email,password,first_name,last_name,phone_number,can_create_content',
+            'alice,alice@example.com,secret,Alice,A,5551234,true',
+            'bob,,secret,,,,no',
+            'alice,alice@example.com,secret,,,,',
+            'existing,,,,,,',
+        ]))
+        self.assertEqual(stderr, '')
+        self.assertIn('Imported 2 users, skipped 2 existing or duplicate and 0 invalid', stdout)
+        alice = User.objects.get(username='alice')
+        self.assertTrue(alice.check_password('secret'))
+        self.assertEqual(alice.profile.phone_number, '5551234')
+        self.assertTrue(alice.profile.can_create_content)
+        self.assertIsNone(User.objects.get(username='bob').profile.phone_number)
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        stdout, stderr = self.import_file('.ndjson', '\n'.join([
+            json.dumps({'username': 'good', 'email': 'good@example.com'}),
+            json.dumps({'username': 'bad name!'}),
+            json.dumps({'username': 'x' * 151}),
+            json.dumps({'username': 'mail', 'email': 'not-an-email'}),
+            json.dumps({'username': 'phone', 'phone_number': '1' * 16}),
+            json.dumps({'username': 42}),
+            json.dumps(['not', 'an', 'object']),
+            '{"username": ',
+            '',
+            json.dumps({'username': 'also-good', 'can_create_content': True}),
+        ]))
+        self.assertIn('Imported 2 users, skipped 0 existing or duplicate and 7 invalid', stdout)
+        self.assertEqual(set(User.objects.values_list('username', flat=True)), {'good', 'also-good'})
+        self.assertEqual(UserProfile.objects.count(), 2)
+        self.assertTrue(UserProfile.objects.get(user__username='also-good').can_create_content)
+        for line in ('Line 2: username', 'Line 3: username', 'Line 4: email', 'Line 5: phone_number',
+                     'Line 6: username must be a string', 'Line 7: not an object', 'Line 8: invalid JSON'):
+            self.assertIn(line, stderr)
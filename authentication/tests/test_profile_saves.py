@@ -0,0 +1,41 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from authentication.models import UserProfile
+
+
+class ProfileDirtyTrackingTests(TestCase):
+    def setUp(self):
+        User.objects.create_user('member', password='x')
+        self.user = User.objects.select_related('profile').get(username='member')
+
+    def test_saving_the_user_skips_an_unchanged_profile(self):
+        # Only the users UPDATE; the loaded profile has nothing to write
+        with self.assertNumQueries(1):
+            self.user.save()
+
+    def test_only_changed_fields_are_written(self):
+        profile = self.user.profile
+        profile.phone_number = '5551234'
+        self.assertEqual(profile.get_changed_fields(), ['phone_number'])
+        with self.assertNumQueries(2) as queries:
+            self.user.save()
+        update = queries.captured_queries[-1]['sql']
+        self.assertIn('"phone_number"', update)
+        self.assertNotIn('"can_create_content"', update)
+        self.assertEqual(profile.get_changed_fields(), [])
+        self.assertEqual(UserProfile.objects.get(user=self.user).phone_number, '5551234')
+
+    def test_unloaded_users_profile_is_not_touched(self):
+        user = User.objects.get(username='member')
+        with self.assertNumQueries(1):
+            user.save()
+
+    def test_new_profile_tracks_every_field(self):
+        profile = UserProfile(user=self.user)
+        self.assertEqual(profile.get_changed_fields(), list(UserProfile.TRACKED_FIELDS))
+
+    def test_explicit_update_fields_still_write(self):
+        profile = self.user.profile
+        with self.assertNumQueries(1):
+            profile.save(update_fields=['can_create_content'])
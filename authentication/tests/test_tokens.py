@@ -0,0 +1,39 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+
+class TokenEndpointTests(TestCase):
+    def setUp(self):
+        User.objects.create_user('member', password='member-password')
+        self.client = APIClient()
+        response = self.client.post(
+            '/api/auth/login/', {'username': 'member', 'password': 'member-password'}, format='json'
+        )
+        self.tokens = response.json()['tokens']
+
+    def test_verify(self):
+        response = self.client.post('/api/auth/token/verify/', {'token': self.tokens['access']}, format='json')
+        self.assertEqual(response.status_code, 200)
+        response = self.client.post('/api/auth/token/verify/', {'token': 'not-a-token'}, format='json')
+        self.assertEqual(response.status_code, 401)
+
+    def test_refresh_rotates_and_blacklists_the_old_token(self):
+        response = self.client.post('/api/auth/token/refresh/', {'refresh': self.tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, 200)
+        rotated = response.json()
+        self.assertIn('access', rotated)
+        self.assertIn('refresh', rotated)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {rotated['access']}")
+        self.assertEqual(self.client.get('/api/auth/profile/').status_code, 200)
+        # The rotated-out refresh token can't be replayed
+        response = self.client.post('/api/auth/token/refresh/', {'refresh': self.tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, 401)
+
+    def test_logout_blacklists_the_refresh_token(self):
+        self.assertEqual(self.client.post('/api/auth/logout/', {'refresh': self.tokens['refresh']}, format='json').status_code, 200)
+        response = self.client.post('/api/auth/token/refresh/', {'refresh': self.tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(self.client.post('/api/auth/logout/', {'refresh': self.tokens['refresh']}, format='json').status_code, 400)
+        self.assertEqual(self.client.post('/api/auth/logout/', {}, format='json').status_code, 400)
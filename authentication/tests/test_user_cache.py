@@ -0,0 +1,54 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from authentication.models import user_cache_key
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('member', password='member-password')
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.user).access_token}')
+
+    def test_not_cached_without_a_timeout(self):
+        self.assertEqual(self.client.get('/api/auth/profile/').status_code, 200)
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+
+    @override_settings(AUTH_USER_CACHE_TIMEOUT=60)
+    def test_cached_user_skips_the_database(self):
+        self.assertEqual(self.client.get('/api/auth/profile/').status_code, 200)
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/auth/profile/')
+        self.assertEqual(response.json()['username'], 'member')
+
+    @override_settings(AUTH_USER_CACHE_TIMEOUT=60)
+    def test_password_hash_is_not_cached(self):
+        self.client.get('/api/auth/profile/')
+        entry = cache.get(user_cache_key(self.user.pk))
+        self.assertIsNotNone(entry)
+        self.assertNotIn(self.user.password, repr(entry))
+
+    @override_settings(AUTH_USER_CACHE_TIMEOUT=60)
+    def test_saves_invalidate_the_cached_user(self):
+        self.client.get('/api/auth/profile/')
+        profile = self.user.profile
+        profile.can_create_content = True
+        profile.save()
+        self.assertTrue(self.client.get('/api/auth/profile/').json()['can_create_content'])
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get('/api/auth/profile/').status_code, 401)
+
+    @override_settings(AUTH_USER_CACHE_TIMEOUT=60)
+    def test_saving_a_cached_user_keeps_the_password(self):
+        self.client.get('/api/auth/profile/')
+        response = self.client.put('/api/auth/profile/', {'first_name': 'Changed'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, 'Changed')
+        self.assertTrue(self.user.check_password('member-password'))
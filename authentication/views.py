@@ -2,6 +2,7 @@ from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth.models import User
 from .serializers import UserRegistrationSerializer, UserLoginSerializer, UserSerializer
@@ -45,6 +46,20 @@ def login(request):
         })
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def logout(request):
+    """Blacklist the refresh token so it can no longer be used to get access tokens"""
+    # The refresh token is the credential here, so an expired access token is fine
+    refresh = request.data.get('refresh')
+    if not refresh:
+        return Response({'error': 'Refresh token is required'}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        RefreshToken(refresh).blacklist()
+    except TokenError:
+        return Response({'error': 'Invalid or expired refresh token'}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({'message': 'Logout successful'})
+
 @api_view(['GET', 'PUT'])
 @permission_classes([IsAuthenticated])
 def profile(request):
@@ -75,12 +90,9 @@ def admin_users_list(request):
         return Response({'detail': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
     
     try:
-        users = User.objects.all()
-        print(f"✅ Found {users.count()} users")
-        
-        # Ensure all users have profiles
-        for user in users:
-            UserProfile.objects.get_or_create(user=user)
+        # Ensure all users have profiles, then load them alongside the users
+        UserProfile.objects.create_missing()
+        users = User.objects.select_related('profile')
         
         serializer = UserSerializer(users, many=True)
         print(f"📊 Serialized data for {len(serializer.data)} users")
@@ -0,0 +1,133 @@
+"""
+JSON renderer and parser backed by orjson, falling back to DRF's stdlib
+implementation when orjson is not installed.
+"""
+import datetime
+import decimal
+import io
+
+from django.conf import settings
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def _default(obj):
+    """Types orjson doesn't encode itself, converted the way DRF's JSONEncoder does"""
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    if isinstance(obj, decimal.Decimal):
+        # DRF encodes bare Decimals as numbers; serializer fields already made them strings
+        return float(obj)
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if hasattr(obj, '__getitem__'):
+        try:
+            return dict(obj)
+        except (TypeError, ValueError):
+            pass
+    if hasattr(obj, '__iter__'):
+        return tuple(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+if orjson is not None:
+    # Naive datetimes are written as-is, aware UTC ones with a trailing Z, like DRF
+    _OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def dumps(data, indent=False):
+        """Encode ``data`` as UTF-8 JSON bytes"""
+        return orjson.dumps(data, default=_default, option=_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0))
+
+    loads = orjson.loads
+    DecodeError = orjson.JSONDecodeError
+else:
+    import json
+
+    _encoder = JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    _indented_encoder = JSONEncoder(ensure_ascii=False, indent=2)
+
+    def dumps(data, indent=False):
+        """Encode ``data`` as UTF-8 JSON bytes"""
+        return (_indented_encoder if indent else _encoder).encode(data).encode()
+
+    loads = json.loads
+    DecodeError = ValueError
+
+
+# orjson reads integers outside 64 bits as floats at least this large
+_WIDE = float(2 ** 63)
+
+
+def _has_wide_float(obj):
+    """Whether parsed ``obj`` holds a float that may be a lossy wide integer"""
+    stack = [[obj]]
+    while stack:
+        for value in stack.pop():
+            kind = type(value)
+            if kind is float:
+                if abs(value) >= _WIDE:
+                    return True
+            elif kind is dict:
+                stack.append(value.values())
+            elif kind is list:
+                stack.append(value)
+    return False
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson when it is available.
+
+    Integers wider than 64 bits, which orjson refuses, are passed to DRF's
+    renderer instead. NaN and Infinity are written as null rather than
+    rejected as under DRF's strict JSON; no serializer here produces them, and
+    checking for them would mean walking every payload.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        # orjson only indents by two spaces; any requested indent gets that
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        try:
+            ret = dumps(data, indent=bool(indent))
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Escaped like DRF does, so the output is also valid JavaScript
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser that decodes with orjson when it is available, keeping wide integers exact"""
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        # orjson only reads UTF-8
+        if orjson is None or encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+            return super().parse(stream, media_type, parser_context)
+        data = stream.read()
+        try:
+            parsed = loads(data)
+        except DecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
+        # Rare, so reparse with the stdlib, which keeps such integers exact
+        if _has_wide_float(parsed):
+            return super().parse(io.BytesIO(data), media_type, parser_context)
+        return parsed
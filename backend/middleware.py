@@ -0,0 +1,119 @@
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.middleware.gzip import GZipMiddleware
+from django.utils.decorators import sync_and_async_middleware
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+# Content types that are already compressed; gzipping them again only costs CPU
+COMPRESSED_CONTENT_TYPES = (
+    'image/', 'video/', 'audio/', 'font/woff',
+    'application/zip', 'application/gzip', 'application/x-gzip', 'application/pdf',
+)
+
+
+class ThresholdGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware that leaves small bodies and already-compressed content alone.
+
+    Bodies under GZIP_MIN_LENGTH bytes fit in a packet or two either way, so
+    compressing them only adds latency. Streams are compressed chunk by chunk
+    unless they already carry a Content-Encoding or a compressed media type.
+    """
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding'):
+            return response
+        content_type = response.get('Content-Type', '').lower()
+        if content_type.startswith(COMPRESSED_CONTENT_TYPES):
+            return response
+        if not response.streaming and len(response.content) < getattr(settings, 'GZIP_MIN_LENGTH', 1024):
+            return response
+        return super().process_response(request, response)
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoiseMiddleware that also runs natively under ASGI.
+
+    WhiteNoise 6 is sync-only, so Django would otherwise push every request,
+    not just static ones, through a thread to get past it.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            # Opening and stat-ing the file blocks
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
+
+
+# Per-request query tally; a context variable so it follows async views into
+# the threads their ORM calls run in
+_query_count = ContextVar('query_count', default=None)
+
+
+def _count_query(execute, sql, params, many, context):
+    counter = _query_count.get()
+    if counter is not None:
+        counter[0] += 1
+    return execute(sql, params, many, context)
+
+
+def _install_query_counter(connection, **kwargs):
+    if _count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_count_query)
+
+
+@sync_and_async_middleware
+def query_count_middleware(get_response):
+    """
+    Report the database queries each request made in an X-DB-Queries header.
+
+    For benchmarks (QUERY_COUNT_HEADER=True); unlike connection.queries it
+    works without DEBUG. Queries made while a streaming body is sent are not
+    counted.
+    """
+    connection_created.connect(_install_query_counter)
+    for connection in connections.all(initialized_only=True):
+        _install_query_counter(connection)
+
+    if iscoroutinefunction(get_response):
+        async def middleware(request):
+            counter = [0]
+            token = _query_count.set(counter)
+            try:
+                response = await get_response(request)
+            finally:
+                _query_count.reset(token)
+            response['X-DB-Queries'] = str(counter[0])
+            return response
+    else:
+        def middleware(request):
+            counter = [0]
+            token = _query_count.set(counter)
+            try:
+                response = get_response(request)
+            finally:
+                _query_count.reset(token)
+            response['X-DB-Queries'] = str(counter[0])
+            return response
+    return middleware
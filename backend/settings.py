@@ -35,6 +35,9 @@ CORS_ALLOWED_ORIGIN_REGEXES = [
 ]
 
 CORS_ALLOW_CREDENTIALS = True
+
+# Let browser clients read the pagination and revalidation headers
+CORS_EXPOSE_HEADERS = ['Link', 'X-Next-Cursor', 'ETag']
 CORS_ALLOW_ALL_ORIGINS = False  # Keep this False for security
 
 INSTALLED_APPS = [
@@ -46,6 +49,7 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'rest_framework_simplejwt',
+    'rest_framework_simplejwt.token_blacklist',
     'corsheaders',
     'authentication',
     'content',
@@ -53,7 +57,11 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',  # This should be at the top!
+    # Above everything that produces a body so every response can be compressed
+    'backend.middleware.ThresholdGZipMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    # Serves precompressed, hashed static files before the rest of the stack runs
+    'backend.middleware.AsyncWhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -62,6 +70,10 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Benchmarks read per-request query counts from an X-DB-Queries header
+if os.environ.get('QUERY_COUNT_HEADER', 'False') == 'True':
+    MIDDLEWARE.insert(0, 'backend.middleware.query_count_middleware')
+
 ROOT_URLCONF = 'backend.urls'
 
 TEMPLATES = [
@@ -88,7 +100,9 @@ if 'DATABASE_URL' in os.environ:
     DATABASES = {
         'default': dj_database_url.config(
             default=os.environ.get('DATABASE_URL'),
-            conn_max_age=600,
+            # Django doesn't reuse connections across async requests, so under
+            # ASGI persistent ones would only pile up
+            conn_max_age=0 if os.environ.get('ASGI', 'False') == 'True' else 600,
             conn_health_checks=True,
         )
     }
@@ -125,23 +139,87 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+# collectstatic writes hashed, gzip- and brotli-compressed copies that WhiteNoise
+# serves with a year-long immutable Cache-Control
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+# Fall back to unhashed names instead of erroring if collectstatic hasn't run
+WHITENOISE_MANIFEST_STRICT = False
+
+# ASGI=True when serving backend.asgi (see gunicorn.conf.py); routes the
+# read-heavy content endpoints to their async views
+CONTENT_ASYNC_VIEWS = os.environ.get('ASGI', 'False') == 'True'
+
+# Responses smaller than this are sent uncompressed
+GZIP_MIN_LENGTH = int(os.environ.get('GZIP_MIN_LENGTH', 1024))
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'authentication.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # orjson-backed JSON; falls back to DRF's stdlib encoder if orjson isn't installed
+    'DEFAULT_RENDERER_CLASSES': [
+        'backend.fastjson.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'backend.fastjson.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
+# Cache - locmem per process by default; set CACHE_DIR to share a file cache between workers
+if os.environ.get('CACHE_DIR'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ['CACHE_DIR'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Seconds a cached news/events list page may be served; saves invalidate it sooner.
+# Like the user cache below, this needs a cache every worker shares: with the
+# per-process locmem cache a save would leave the other workers' pages stale
+CONTENT_LIST_CACHE_TIMEOUT = int(os.environ.get('CONTENT_LIST_CACHE_TIMEOUT', 60)) if os.environ.get('CACHE_DIR') else 0
+
+# Page size for the cursor-paginated content lists (?page_size= is capped at the max)
+CONTENT_PAGE_SIZE = int(os.environ.get('CONTENT_PAGE_SIZE', 10))
+CONTENT_MAX_PAGE_SIZE = int(os.environ.get('CONTENT_MAX_PAGE_SIZE', 100))
+
+# Seconds between write-behind flushes of buffered News.views increments
+VIEW_COUNT_FLUSH_INTERVAL = int(os.environ.get('VIEW_COUNT_FLUSH_INTERVAL', 10))
+
+# Seconds an authenticated user (with profile) is cached between requests. Saves
+# only invalidate the cache of the process they run in, so with the per-process
+# locmem cache a deactivated user would stay signed in on the other workers;
+# caching is off unless CACHE_DIR gives the workers a shared cache
+AUTH_USER_CACHE_TIMEOUT = int(os.environ.get('AUTH_USER_CACHE_TIMEOUT', 60)) if os.environ.get('CACHE_DIR') else 0
+
 # JWT settings
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
     'ROTATE_REFRESH_TOKENS': True,
+    'BLACKLIST_AFTER_ROTATION': True,  # A rotated-out refresh token can't be replayed
 }
 
 # CSRF settings
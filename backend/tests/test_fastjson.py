@@ -0,0 +1,65 @@
+import io
+import math
+from datetime import timedelta
+from decimal import Decimal
+from unittest import skipIf
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from backend.fastjson import FastJSONParser, FastJSONRenderer, orjson
+
+
+@skipIf(orjson is None, 'orjson is not installed')
+class FastJSONRendererTests(SimpleTestCase):
+    def assertSameAsDRF(self, data):
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_matches_drf(self):
+        now = timezone.now()
+        self.assertSameAsDRF({
+            'text': 'café\u2028line\u2029<script>',
+            'numbers': [0, -1, 1.5, 2 ** 63 - 1, True, None],
+            'nested': {'list': [{'a': []}], 'tuple': (1, 2)},
+            'when': now,
+            'lazy': gettext_lazy('Hello'),
+            'price': Decimal('199.00'),
+            'duration': timedelta(minutes=90),
+        })
+        self.assertSameAsDRF([])
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+    def test_wide_integers_fall_back_to_drf(self):
+        self.assertSameAsDRF({'id': 2 ** 64 + 1, 'ids': [-(2 ** 70)]})
+
+    def test_non_finite_floats_render_as_null(self):
+        self.assertEqual(FastJSONRenderer().render({'x': math.nan, 'y': math.inf}), b'{"x":null,"y":null}')
+
+    def test_indent(self):
+        body = FastJSONRenderer().render({'a': 1}, 'application/json; indent=4')
+        self.assertEqual(body, b'{\n  "a": 1\n}')
+
+
+@skipIf(orjson is None, 'orjson is not installed')
+class FastJSONParserTests(SimpleTestCase):
+    def parse(self, body, parser=None):
+        return (parser or FastJSONParser()).parse(io.BytesIO(body))
+
+    def test_matches_drf(self):
+        body = '{"text": "café", "n": [1, -2.5, 9223372036854775807, true, null], "o": {}}'.encode()
+        self.assertEqual(self.parse(body), self.parse(body, JSONParser()))
+
+    def test_wide_integers_stay_exact(self):
+        data = self.parse(b'{"big": 123456789012345678901234567890, "neg": -9223372036854775809, "f": 1e30}')
+        self.assertEqual(data['big'], 123456789012345678901234567890)
+        self.assertEqual(data['neg'], -9223372036854775809)
+        self.assertEqual(data['f'], 1e30)
+        self.assertEqual(self.parse(b'18446744073709551616'), 2 ** 64)
+
+    def test_invalid_json(self):
+        with self.assertRaises(ParseError):
+            self.parse(b'{"a": ')
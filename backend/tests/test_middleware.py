@@ -0,0 +1,52 @@
+import gzip
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from backend.middleware import ThresholdGZipMiddleware
+
+BODY = b'{"title": "Security Summit"}' * 100
+
+
+@override_settings(GZIP_MIN_LENGTH=1024)
+class ThresholdGZipMiddlewareTests(SimpleTestCase):
+    def process(self, response, accept_encoding='gzip, br'):
+        headers = {'HTTP_ACCEPT_ENCODING': accept_encoding} if accept_encoding else {}
+        request = RequestFactory().get('/', **headers)
+        return ThresholdGZipMiddleware(lambda request: response)(request)
+
+    def test_small_bodies_are_left_alone(self):
+        response = self.process(HttpResponse(BODY[:1000], content_type='application/json'))
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, BODY[:1000])
+
+    def test_large_bodies_are_gzipped(self):
+        response = self.process(HttpResponse(BODY, content_type='application/json'))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(gzip.decompress(response.content), BODY)
+
+    def test_clients_without_gzip(self):
+        response = self.process(HttpResponse(BODY, content_type='application/json'), accept_encoding=None)
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, BODY)
+
+    def test_encoded_and_compressed_content_is_left_alone(self):
+        encoded = HttpResponse(BODY, content_type='application/json')
+        encoded['Content-Encoding'] = 'br'
+        self.assertEqual(self.process(encoded)['Content-Encoding'], 'br')
+        for content_type in ('image/png', 'application/zip', 'application/pdf'):
+            response = self.process(HttpResponse(BODY, content_type=content_type))
+            self.assertFalse(response.has_header('Content-Encoding'), content_type)
+
+    def test_streams_are_gzipped_whatever_their_size(self):
+        response = self.process(StreamingHttpResponse(iter([b'a', b'b']), content_type='text/csv'))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), b'ab')
+        response = self.process(StreamingHttpResponse(iter([BODY]), content_type='video/mp4'))
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    @override_settings(GZIP_MIN_LENGTH=256)
+    def test_threshold_setting(self):
+        response = self.process(HttpResponse(BODY[:300], content_type='application/json'))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
@@ -1,6 +1,11 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class ContentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'content'
+
+    def ready(self):
+        from .search import restore_sqlite_fts_triggers
+        post_migrate.connect(restore_sqlite_fts_triggers, sender=self)
@@ -0,0 +1,239 @@
+"""
+Async versions of the read-heavy and streaming content endpoints, routed in
+place of the sync views when CONTENT_ASYNC_VIEWS is on (i.e. when serving
+under ASGI).
+
+GET requests are answered on the event loop with the async ORM, so a slow
+client holds a coroutine rather than a worker. Streams are fed from
+QuerySet.aiterator(); Django would read a sync iterator into memory before
+sending it under ASGI. Other methods are handed to the sync DRF views
+unchanged.
+"""
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from rest_framework import exceptions, status
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from authentication.models import UserProfile
+from backend.fastjson import FastJSONRenderer
+from . import views
+from .cache import get_cached_list, set_cached_list
+from .conditional import make_etag, not_modified, set_validators
+from .counters import news_view_counter
+from .models import News, Event, EventRegistration
+from .pagination import InvalidCursor, apaginate_keyset, next_page_headers
+from .serializers import InvalidFieldset, NewsSerializer, EventSerializer
+from .streaming import STREAM_CHUNK_SIZE, STREAM_FORMATS, streaming_csv_response, streaming_json_response
+
+
+def json_response(data, status=status.HTTP_200_OK, headers=None):
+    return HttpResponse(
+        FastJSONRenderer().render(data), status=status, headers=headers, content_type='application/json'
+    )
+
+
+def _error_response(exc, request=None):
+    """The response DRF's exception handler would send for ``exc``"""
+    data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+    response = json_response(data, status=exc.status_code)
+    if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+        authenticators = request.authenticators if request else ()
+        if authenticators:
+            response.status_code = status.HTTP_401_UNAUTHORIZED
+            response['WWW-Authenticate'] = authenticators[0].authenticate_header(request)
+        else:
+            response.status_code = status.HTTP_403_FORBIDDEN
+    return response
+
+
+def async_read_view(sync_view):
+    """
+    Serve GET with the decorated coroutine and every other method with ``sync_view``.
+
+    The coroutine receives a DRF Request whose user has been authenticated with
+    the configured authentication classes; anonymous requests get a 401, as they
+    would from the sync view's IsAuthenticated.
+    """
+    def decorator(read):
+        @wraps(read)
+        async def view(request, *args, **kwargs):
+            if request.method != 'GET':
+                return await sync_to_async(sync_view)(request, *args, **kwargs)
+
+            request = Request(
+                request, authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+            )
+            try:
+                # Token checks may hit the cache and the database
+                user = await sync_to_async(lambda: request.user)()
+                if not user.is_authenticated:
+                    raise exceptions.NotAuthenticated()
+            except exceptions.APIException as exc:
+                return _error_response(exc, request)
+            return await read(request, *args, **kwargs)
+
+        # Same as the sync API views, which DRF exempts from CSRF
+        view.csrf_exempt = True
+        return view
+    return decorator
+
+
+async def registered_event_ids(user, event_ids):
+    """Which of ``event_ids`` the user is registered for, in one query"""
+    queryset = (
+        EventRegistration.objects.filter(user=user, event_id__in=event_ids)
+        .order_by().values_list('event_id', flat=True)
+    )
+    return {event_id async for event_id in queryset}
+
+
+def _not_found():
+    return _error_response(exceptions.NotFound())
+
+
+def _bad_request(message):
+    return json_response({'error': message}, status=status.HTTP_400_BAD_REQUEST)
+
+
+@async_read_view(views.news_list)
+async def news_list(request):
+    try:
+        fieldset = NewsSerializer.fieldset(request, NewsSerializer.Meta.list_fields)
+    except InvalidFieldset as e:
+        return _bad_request(str(e))
+
+    cached = await sync_to_async(get_cached_list)('news', request)
+    if cached is None:
+        news = News.objects.select_related('author__profile').defer(*NewsSerializer.deferred_fields(**fieldset))
+        try:
+            news, next_cursor = await apaginate_keyset(request, news, 'created_at', descending=True)
+        except InvalidCursor:
+            return _bad_request('Invalid cursor')
+        serializer = NewsSerializer(news, many=True, **fieldset)
+        cached = {'data': serializer.data, 'next_cursor': next_cursor}
+        await sync_to_async(set_cached_list)('news', request, cached)
+    return json_response(cached['data'], headers=next_page_headers(request, cached['next_cursor']))
+
+
+@async_read_view(views.news_detail)
+async def news_detail(request, pk):
+    try:
+        fieldset = NewsSerializer.fieldset(request)
+    except InvalidFieldset as e:
+        return _bad_request(str(e))
+    try:
+        news = await News.objects.select_related('author__profile').aget(pk=pk)
+    except News.DoesNotExist:
+        return _not_found()
+
+    # Only touches memory; the background flush does the UPDATE
+    news_view_counter.record(news.pk)
+
+    etag = make_etag('news', news.pk, news.updated_at.isoformat())
+    response = not_modified(request, etag, news.updated_at)
+    if response is None:
+        response = json_response(NewsSerializer(news, **fieldset).data)
+    return set_validators(response, etag, news.updated_at)
+
+
+@async_read_view(views.events_list)
+async def events_list(request):
+    try:
+        fieldset = EventSerializer.fieldset(request, EventSerializer.Meta.list_fields)
+    except InvalidFieldset as e:
+        return _bad_request(str(e))
+
+    cached = await sync_to_async(get_cached_list)('events', request)
+    if cached is None:
+        events = Event.objects.select_related('author__profile').defer(*EventSerializer.deferred_fields(**fieldset))
+        try:
+            events, next_cursor = await apaginate_keyset(request, events, 'date')
+        except InvalidCursor:
+            return _bad_request('Invalid cursor')
+        # The cached body is shared by all users; is_registered is overlaid per request below
+        serializer = EventSerializer(
+            events, many=True, context={'request': request, 'registered_event_ids': set()}, **fieldset
+        )
+        cached = {'data': serializer.data, 'next_cursor': next_cursor}
+        await sync_to_async(set_cached_list)('events', request, cached)
+
+    events_data = cached['data']
+    if 'is_registered' in EventSerializer.field_names(**fieldset):
+        registered = await registered_event_ids(request.user, [event['id'] for event in events_data])
+        events_data = [{**event, 'is_registered': event['id'] in registered} for event in events_data]
+    return json_response(events_data, headers=next_page_headers(request, cached['next_cursor']))
+
+
+@async_read_view(views.event_detail)
+async def event_detail(request, pk):
+    try:
+        fieldset = EventSerializer.fieldset(request)
+    except InvalidFieldset as e:
+        return _bad_request(str(e))
+    try:
+        event = await Event.objects.select_related('author__profile').aget(pk=pk)
+    except Event.DoesNotExist:
+        return _not_found()
+
+    context = {'request': request, 'registered_event_ids': set()}
+    if 'is_registered' in EventSerializer.field_names(**fieldset):
+        context['registered_event_ids'] = await registered_event_ids(request.user, [event.pk])
+    etag = make_etag(
+        'event', event.pk, event.updated_at.isoformat(), event.registered,
+        event.pk in context['registered_event_ids']
+    )
+    response = not_modified(request, etag)
+    if response is None:
+        response = json_response(EventSerializer(event, context=context, **fieldset).data)
+    return set_validators(response, etag, vary=['Authorization'])
+
+
+def _forbidden(message):
+    return json_response({'error': message}, status=status.HTTP_403_FORBIDDEN)
+
+
+@async_read_view(views.users_list)
+async def users_list(request):
+    if not (request.user.is_staff or request.user.is_superuser):
+        return _forbidden('You do not have permission to view users')
+
+    stream_format = request.query_params.get('stream')
+    if stream_format and stream_format not in STREAM_FORMATS:
+        return _bad_request(f'stream must be one of: {", ".join(STREAM_FORMATS)}')
+
+    # Ensure every user has a profile, then load them alongside the users
+    await sync_to_async(UserProfile.objects.create_missing)()
+    users = User.objects.select_related('profile').order_by('id')
+
+    if stream_format:
+        rows = (views.user_admin_row(user) async for user in users.aiterator(chunk_size=STREAM_CHUNK_SIZE))
+        return streaming_json_response(rows, stream_format)
+
+    return json_response([views.user_admin_row(user) async for user in users])
+
+
+@async_read_view(views.export_event_registrations)
+async def export_event_registrations(request, pk):
+    if not (request.user.is_staff or request.user.is_superuser):
+        return _forbidden('You do not have permission to export event registrations')
+
+    stream_format = request.query_params.get('stream', 'csv')
+    if stream_format not in ('csv', 'ndjson'):
+        return _bad_request('stream must be one of: csv, ndjson')
+
+    if not await Event.objects.filter(pk=pk).aexists():
+        return _not_found()
+    registrations = (
+        EventRegistration.objects.filter(event_id=pk)
+        .select_related('user__profile')
+        .aiterator(chunk_size=STREAM_CHUNK_SIZE)
+    )
+    rows = (views.registration_export_row(registration) async for registration in registrations)
+
+    if stream_format == 'csv':
+        return streaming_csv_response(rows, views.REGISTRATION_EXPORT_COLUMNS, f'event-{pk}-registrations.csv')
+    return streaming_json_response(rows, 'ndjson')
@@ -0,0 +1,49 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def _generation_key(name):
+    return f'content:{name}:generation'
+
+
+def _generation(name):
+    """Current generation of a cached list; bumping it orphans every cached page"""
+    generation = cache.get(_generation_key(name))
+    if generation is None:
+        generation = time.time_ns()
+        cache.add(_generation_key(name), generation, None)
+        generation = cache.get(_generation_key(name), generation)
+    return generation
+
+
+def list_cache_key(name, request):
+    """Cache key for one page of a list endpoint, covering its query string"""
+    query = '&'.join(sorted(request.GET.urlencode().split('&')))
+    digest = hashlib.md5(query.encode()).hexdigest()
+    return f'content:{name}:{_generation(name)}:{digest}'
+
+
+def _timeout():
+    # 0 turns list caching off; see CONTENT_LIST_CACHE_TIMEOUT in settings
+    return getattr(settings, 'CONTENT_LIST_CACHE_TIMEOUT', 0)
+
+
+def get_cached_list(name, request):
+    if not _timeout():
+        return None
+    return cache.get(list_cache_key(name, request))
+
+
+def set_cached_list(name, request, payload):
+    if _timeout():
+        cache.set(list_cache_key(name, request), payload, _timeout())
+
+
+def invalidate_list_cache(*names):
+    """Start a new generation for each named list so stale pages are never served"""
+    for name in names:
+        # A fresh timestamp never collides with an older generation, even if the key was evicted
+        cache.set(_generation_key(name), time.time_ns(), None)
@@ -0,0 +1,37 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+
+
+def make_etag(*parts):
+    """
+    Weak ETag over the values a representation depends on.
+
+    Weak because bodies may differ in fields that don't invalidate a cached
+    copy, such as the live view count of an article.
+    """
+    digest = hashlib.md5(':'.join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified(request, etag, last_modified=None):
+    """
+    Return a 304 response if the client's If-None-Match / If-Modified-Since
+    validators still match, otherwise None.
+    """
+    return get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+
+
+def set_validators(response, etag, last_modified=None, vary=None):
+    """Attach ETag / Last-Modified so the client can revalidate next time"""
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    if vary:
+        patch_vary_headers(response, vary)
+    return response
@@ -0,0 +1,106 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import F
+
+from .models import News
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    """
+    Write-behind counter for a model's integer column.
+
+    Increments are accumulated in memory per worker and written back as
+    ``UPDATE ... SET views = views + n`` statements by a background thread
+    every flush interval, so readers never wait on the row lock and
+    ``updated_at`` is left untouched. Rows that gained the same delta share
+    one UPDATE.
+    """
+
+    def __init__(self, model, field='views', interval_setting='VIEW_COUNT_FLUSH_INTERVAL'):
+        self.model = model
+        self.field = field
+        self.interval_setting = interval_setting
+        self._pending = Counter()
+        self._lock = threading.Lock()
+        self._flusher = None
+        self._flusher_pid = None
+
+    @property
+    def interval(self):
+        return getattr(settings, self.interval_setting, 10)
+
+    def record(self, pk, amount=1):
+        """Count a view of ``pk``; it is written by the next periodic flush"""
+        with self._lock:
+            self._pending[pk] += amount
+            # Started on first use, and again in a forked worker, where threads don't survive
+            if self._flusher_pid != os.getpid():
+                self._flusher_pid = os.getpid()
+                self._flusher = threading.Thread(
+                    target=self._flush_periodically, name=f'{self.model.__name__}-{self.field}-flusher', daemon=True
+                )
+                self._flusher.start()
+
+    def _flush_periodically(self):
+        while True:
+            time.sleep(self.interval)
+            if not self._pending:
+                continue
+            try:
+                self.flush()
+            except Exception:
+                # Unwritten increments were put back; the next interval retries them
+                logger.exception('Flushing %s.%s increments failed', self.model.__name__, self.field)
+            finally:
+                # Don't hold this thread's connection open between flushes
+                connections.close_all()
+
+    def pending(self, pk):
+        """Views of ``pk`` recorded by this worker but not yet written"""
+        return self._pending.get(pk, 0)
+
+    def reset(self):
+        """Drop every pending increment without writing it"""
+        with self._lock:
+            self._pending.clear()
+
+    def flush(self):
+        """Write all pending increments to the database"""
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+
+        by_delta = defaultdict(list)
+        for pk, delta in pending.items():
+            by_delta[delta].append(pk)
+
+        while by_delta:
+            delta, pks = by_delta.popitem()
+            try:
+                self.model.objects.filter(pk__in=pks).update(**{self.field: F(self.field) + delta})
+            except Exception:
+                # Put back whatever was not written so the next flush retries it
+                with self._lock:
+                    for unwritten_delta, unwritten_pks in [(delta, pks), *by_delta.items()]:
+                        for pk in unwritten_pks:
+                            self._pending[pk] += unwritten_delta
+                raise
+
+
+news_view_counter = ViewCounter(News)
+
+
+@atexit.register
+def _flush_on_exit():
+    try:
+        news_view_counter.flush()
+    except Exception:
+        pass
@@ -0,0 +1,39 @@
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+
+def parse_date_bound(value, end=False):
+    """
+    Turn a ?start= / ?end= value into a (lookup, aware datetime) pair.
+
+    Accepts ISO dates or datetimes. A bare date used as an end bound covers the
+    whole day. Raises ValueError for anything else.
+    """
+    # Check for a bare date first: parse_datetime also accepts one, as midnight
+    day = parse_date(value)
+    if day is not None:
+        if end:
+            return 'lt', timezone.make_aware(datetime.combine(day + timedelta(days=1), time.min))
+        return 'gte', timezone.make_aware(datetime.combine(day, time.min))
+
+    parsed = parse_datetime(value)
+    if parsed is None:
+        raise ValueError(value)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return ('lte' if end else 'gte'), parsed
+
+
+def filter_events(queryset, params):
+    """Apply the ?start=, ?end=, ?category= and ?location= filters shared by the event endpoints"""
+    for param, end in (('start', False), ('end', True)):
+        if params.get(param):
+            lookup, value = parse_date_bound(params[param], end=end)
+            queryset = queryset.filter(**{f'date__{lookup}': value})
+    if params.get('category'):
+        queryset = queryset.filter(category=params['category'])
+    if params.get('location'):
+        queryset = queryset.filter(location__icontains=params['location'])
+    return queryset
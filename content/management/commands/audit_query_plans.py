@@ -0,0 +1,180 @@
+import io
+import json
+import re
+from contextlib import redirect_stdout
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from content.counters import news_view_counter
+from content.models import News, Event
+
+# Full-table scans on SQLite; index scans say "USING ... INDEX", FTS5 lookups "VIRTUAL TABLE"
+SQLITE_FULL_SCAN = re.compile(r'^SCAN (TABLE )?(?P<table>\w+)$')
+SQLITE_TEMP_SORT = 'USE TEMP B-TREE'
+
+# Issues that are inherent to an endpoint rather than regressions: the users
+# lists read every user, search orders by relevance, which no index holds, and
+# my events sorts one user's registrations by a column of the joined event
+EXPECTED_ISSUES = {
+    'search': ('temporary sort', 'sort on'),
+    'my events': ('temporary sort', 'sort on'),
+    'admin users list': ('sequential scan on auth_user',),
+    'auth admin users list': ('sequential scan on auth_user',),
+}
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        'Run EXPLAIN on the queries behind every list/detail endpoint and flag '
+        'sequential scans and temporary sorts. Run it against realistically sized '
+        'data: planners prefer sequential scans on tiny tables.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', help='Staff user to call the endpoints as (default: first staff user)')
+        parser.add_argument('--fail', action='store_true', help='Exit with an error if any query is flagged')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    def endpoints(self):
+        """(label, url) for every read endpoint, using existing rows for detail routes"""
+        news = News.objects.order_by('-created_at').first()
+        event = Event.objects.order_by('date').first()
+        endpoints = [
+            ('news list', reverse('news-list')),
+            ('events list', reverse('events-list')),
+            ('events calendar', reverse('events-calendar') + '?include_past=true'),
+            ('my events', reverse('my-events') + '?when=all'),
+            ('search', reverse('content-search') + '?q=event'),
+            ('admin events overview', reverse('admin-events-overview')),
+            # Both apps name their users list 'admin-users-list', so spell these out
+            ('admin users list', '/api/content/admin/users/'),
+            ('auth admin users list', '/api/auth/admin/users/'),
+            ('profile', reverse('profile')),
+        ]
+        if news:
+            endpoints.append(('news detail', reverse('news-detail', args=[news.pk])))
+        if event:
+            endpoints += [
+                ('event detail', reverse('event-detail', args=[event.pk])),
+                ('event registrations', reverse('event-registrations', args=[event.pk])),
+                ('event waitlist', reverse('event-waitlist', args=[event.pk])),
+            ]
+        return endpoints
+
+    def explain(self, sql):
+        """Return (plan lines, issues) for one SELECT"""
+        with connection.cursor() as cursor:
+            if connection.vendor == 'sqlite':
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+                lines = [row[-1] for row in cursor.fetchall()]
+                issues = []
+                for line in lines:
+                    match = SQLITE_FULL_SCAN.match(line)
+                    if match:
+                        issues.append(f'sequential scan on {match.group("table")}')
+                    elif line.startswith(SQLITE_TEMP_SORT):
+                        issues.append(f'temporary sort ({line})')
+                return lines, issues
+
+            if connection.vendor == 'postgresql':
+                cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}')
+                plan = cursor.fetchone()[0]
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                lines, issues = [], []
+                stack = [(plan[0]['Plan'], 0)]
+                while stack:
+                    node, depth = stack.pop()
+                    relation = node.get('Relation Name')
+                    lines.append('  ' * depth + node['Node Type'] + (f' on {relation}' if relation else ''))
+                    if node['Node Type'] == 'Seq Scan':
+                        issues.append(f'sequential scan on {relation}')
+                    elif node['Node Type'] in ('Sort', 'Incremental Sort'):
+                        issues.append(f'sort on {", ".join(node.get("Sort Key", []))}')
+                    stack.extend((child, depth + 1) for child in reversed(node.get('Plans', [])))
+                return lines, issues
+
+        raise CommandError(f'EXPLAIN is not supported on {connection.vendor}')
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(is_staff=True)
+        if options['username']:
+            users = User.objects.filter(username=options['username'])
+        user = users.order_by('pk').first()
+        if user is None:
+            raise CommandError('No staff user to run the endpoints as; pass --username')
+
+        client = APIClient()
+        client.force_authenticate(user)
+        report = []
+
+        # Views the detail endpoints count are buffered, not rolled back: write
+        # out what was pending before the run and drop the audit's own counts after
+        news_view_counter.flush()
+
+        # Bypass the response cache so every query runs, and roll back anything the endpoints write
+        with override_settings(
+            CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+            ALLOWED_HOSTS=['testserver'],
+        ):
+            try:
+                with transaction.atomic():
+                    for label, url in self.endpoints():
+                        # Some views print debug output; keep it out of the report
+                        with CaptureQueriesContext(connection) as captured, redirect_stdout(io.StringIO()):
+                            response = client.get(url)
+                        queries = []
+                        for query in captured.captured_queries:
+                            sql = query['sql']
+                            if not sql.lstrip().upper().startswith('SELECT'):
+                                continue
+                            lines, issues = self.explain(sql)
+                            expected = [
+                                issue for issue in issues
+                                if issue.startswith(EXPECTED_ISSUES.get(label, ()))
+                            ]
+                            queries.append({
+                                'sql': sql,
+                                'plan': lines,
+                                'issues': [issue for issue in issues if issue not in expected],
+                                'expected_issues': expected,
+                            })
+                        report.append({
+                            'endpoint': label,
+                            'url': url,
+                            'status': response.status_code,
+                            'queries': queries,
+                        })
+                    raise Rollback
+            except Rollback:
+                pass
+            finally:
+                news_view_counter.reset()
+
+        flagged = sum(1 for endpoint in report for query in endpoint['queries'] if query['issues'])
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            for endpoint in report:
+                self.stdout.write(f"{endpoint['endpoint']} ({endpoint['url']}) -> {endpoint['status']}, "
+                                  f"{len(endpoint['queries'])} queries")
+                for query in endpoint['queries']:
+                    if query['issues']:
+                        self.stdout.write(self.style.WARNING(f"  {'; '.join(query['issues'])}"))
+                        self.stdout.write(f"    {query['sql']}")
+                        for line in query['plan']:
+                            self.stdout.write(f"      {line}")
+            summary = f'{flagged} flagged queries across {len(report)} endpoints'
+            self.stdout.write(self.style.WARNING(summary) if flagged else self.style.SUCCESS(summary))
+
+        if options['fail'] and flagged:
+            raise CommandError(f'{flagged} queries use sequential scans or temporary sorts')
@@ -0,0 +1,466 @@
+import gzip
+import json
+import math
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from http.client import HTTPConnection, HTTPException
+from importlib import import_module
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+from django.utils import timezone
+
+from content.management.commands.seed_benchmark_data import DEFAULT_PASSWORD, WORDS, benchmark_username
+
+# Where each app's urls are mounted in backend/urls.py
+APP_PREFIXES = {
+    'content': '/api/content',
+    'authentication': '/api/auth',
+}
+
+# How many members hold tokens during the run; requests rotate through them
+MEMBER_SESSIONS = 20
+
+# ``build(i)`` returns (path kwargs, query string, JSON body, token) for the
+# i-th request, or None once the scenario's inputs are used up; ``record(i,
+# status, body)`` keeps what later scenarios need from the responses
+Scenario = namedtuple('Scenario', 'app route method build record hashing', defaults=(None, False))
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return None
+    # The smallest value with at least ``fraction`` of the samples at or below it;
+    # rounding first keeps float error (0.7 * 10 = 7.000000000000001) from adding a rank
+    rank = math.ceil(round(fraction * len(ordered), 9))
+    index = max(0, min(len(ordered) - 1, rank - 1))
+    return ordered[index]
+
+
+def using(item, build):
+    """``build(item)``, or None when a scenario has run out of items"""
+    return None if item is None else build(item)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed a throwaway database, start the app under gunicorn and drive every route in '
+        'content/urls.py and authentication/urls.py with concurrent requests. Prints '
+        'throughput, p50/p95/p99 latency and database queries per request as JSON.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='Requests per scenario')
+        parser.add_argument('--hashing-requests', type=int, default=20,
+                            help='Requests for login/register, which hash a password each time')
+        parser.add_argument('--concurrency', type=int, default=16, help='Client threads')
+        parser.add_argument('--warmup', type=int, default=5, help='Unmeasured GETs per read scenario')
+        parser.add_argument('--workers', type=int, default=2, help='gunicorn worker processes')
+        parser.add_argument('--asgi', action='store_true', help='Serve backend.asgi with uvicorn workers')
+        parser.add_argument('--database-url', help='Empty database to seed (default: a temporary SQLite file)')
+        parser.add_argument('--route', action='append', help='Only run scenarios for this route name (repeatable)')
+        parser.add_argument('--output', help='Write the JSON report here instead of stdout')
+        parser.add_argument('--keep', action='store_true', help='Keep the temporary database and server log')
+        for option, default in (('users', 500), ('news', 1000), ('events', 300), ('registrations', 40), ('seed', 0)):
+            parser.add_argument(f'--{option}', type=int, default=default, help='Passed to seed_benchmark_data')
+
+    # Server
+
+    def manage(self, env, *args):
+        result = subprocess.run(
+            [sys.executable, 'manage.py', *args], cwd=settings.BASE_DIR, env=env,
+            capture_output=True, text=True,
+        )
+        if result.returncode:
+            raise CommandError(f'manage.py {args[0]} failed:\n{result.stderr or result.stdout}')
+
+    def start_server(self, env, workers, log_path):
+        port = free_port()
+        log = open(log_path, 'w')
+        # gunicorn.conf.py picks the app and worker class from ASGI
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-b', f'127.0.0.1:{port}', '-w', str(workers), '--timeout', '120'],
+            cwd=settings.BASE_DIR, env=env, stdout=log, stderr=subprocess.STDOUT,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise CommandError(f'The server exited during startup; see {log_path}')
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=1).close()
+                return server, port
+            except OSError:
+                time.sleep(0.2)
+        server.terminate()
+        raise CommandError(f'The server did not start listening within 30s; see {log_path}')
+
+    # Client
+
+    def send(self, method, path, token=None, body=None):
+        """Make one request on this thread's connection; returns (status, seconds, queries, bytes, body)"""
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = self.local.connection = HTTPConnection('127.0.0.1', self.port, timeout=120)
+        headers = {'Accept': 'application/json', 'Accept-Encoding': 'gzip'}
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers['Content-Type'] = 'application/json'
+
+        start = time.perf_counter()
+        try:
+            connection.request(method, path, payload, headers)
+            response = connection.getresponse()
+            data = response.read()
+        except (OSError, ConnectionError, HTTPException):
+            connection.close()
+            self.local.connection = None
+            return None, time.perf_counter() - start, None, 0, b''
+        elapsed = time.perf_counter() - start
+
+        size = len(data)
+        if response.getheader('Content-Encoding') == 'gzip':
+            data = gzip.decompress(data)
+        queries = response.getheader('X-DB-Queries')
+        return response.status, elapsed, int(queries) if queries is not None else None, size, data
+
+    def url(self, app, route, kwargs=None, query=''):
+        path = APP_PREFIXES[app] + reverse(route, urlconf=f'{app}.urls', kwargs=kwargs)
+        return f'{path}?{query}' if query else path
+
+    def call(self, app, route, method='GET', kwargs=None, query='', body=None, token=None):
+        """Unmeasured request used for setup; returns the decoded JSON body"""
+        status, _, _, _, data = self.send(method, self.url(app, route, kwargs, query), token, body)
+        if status is None or status >= 400:
+            raise CommandError(f'{method} {route} failed during setup with status {status}: {data[:200]!r}')
+        return json.loads(data) if data else None
+
+    # Scenarios
+
+    def prepare(self, options):
+        """Log in the staff user and some members and look up ids to aim requests at"""
+        password = DEFAULT_PASSWORD
+        staff = self.call('authentication', 'login', 'POST', body={'username': benchmark_username(0), 'password': password})
+        self.staff = staff['tokens']['access']
+        self.members = []
+        for index in range(1, min(MEMBER_SESSIONS, options['users'] - 1) + 1):
+            login = self.call('authentication', 'login', 'POST', body={'username': benchmark_username(index), 'password': password})
+            self.members.append((login['user']['id'], login['tokens']['access']))
+        if not self.members:
+            raise CommandError('Seed at least two users so there are members to act as')
+
+        events = self.call('content', 'admin-events-overview', token=self.staff)
+        now = timezone.now().isoformat()
+        self.event_ids = [event['id'] for event in events]
+        upcoming = [event for event in events if event['date'] >= now]
+        self.open_event_ids = [event['id'] for event in upcoming if not event['is_full']] or self.event_ids
+        self.full_event_ids = [event['id'] for event in upcoming if event['is_full']] or self.event_ids
+        self.news_ids = [item['id'] for item in self.call('content', 'news-list', query='fields=id&page_size=100', token=self.staff)]
+        users = self.call('authentication', 'admin-users-list', token=self.staff)
+        self.user_ids = [user['id'] for user in users if not user['is_staff']]
+        if not self.event_ids or not self.news_ids:
+            raise CommandError('Seed at least one news article and one event')
+
+        # Filled in by the write scenarios for the ones that follow them
+        self.refresh_tokens = {'login': [], 'register': []}
+        self.created = {'news': [], 'events': []}
+        self.registered, self.waitlisted, self.bulk_registered = [], [], []
+
+    def member(self, i):
+        return self.members[i % len(self.members)]
+
+    def pick(self, items, i):
+        return items[i % len(items)]
+
+    def pairs(self, event_ids, i):
+        """The i-th distinct (member, event) combination, or None when they run out"""
+        if i >= len(self.members) * len(event_ids):
+            return None
+        return self.member(i), event_ids[i // len(self.members)]
+
+    def from_list(self, items, i):
+        return items[i] if i < len(items) else None
+
+    def scenarios(self):
+        staff = self.staff
+        member_token = lambda i: self.member(i)[1]
+
+        def keep(bucket, key=None):
+            def record(i, status, body):
+                if status is not None and status < 300:
+                    bucket.append(key(i, json.loads(body)) if key else i)
+            return record
+
+        def keep_pair(bucket, event_ids):
+            def record(i, status, body):
+                if status is not None and status < 300:
+                    (user_id, token), event_id = self.pairs(event_ids, i)
+                    bucket.append((token, event_id))
+            return record
+
+        def as_pair(bucket, i):
+            return using(self.from_list(bucket, i), lambda pair: ({'pk': pair[1]}, '', None, pair[0]))
+
+        def bulk_chunk(i):
+            if i >= len(self.created['events']):
+                return None
+            return self.created['events'][i], [self.pick(self.user_ids, i * 20 + n) for n in range(20)]
+
+        def new_event(i):
+            date = timezone.now() + timedelta(days=30 + i % 60)
+            return {
+                'title': f'Benchmark event {i}', 'description': ' '.join(WORDS), 'category': 'Workshop',
+                'date': date.isoformat(), 'location': 'Benchmark Hall', 'capacity': 100,
+            }
+
+        read = [
+            Scenario('content', 'news-list', 'GET', lambda i: (None, '', None, member_token(i))),
+            Scenario('content', 'news-list', 'GET', lambda i: (None, 'fields=all&page_size=50', None, member_token(i))),
+            Scenario('content', 'news-detail', 'GET', lambda i: ({'pk': self.pick(self.news_ids, i)}, '', None, member_token(i))),
+            Scenario('content', 'events-list', 'GET', lambda i: (None, '', None, member_token(i))),
+            Scenario('content', 'events-calendar', 'GET', lambda i: (None, '', None, member_token(i))),
+            Scenario('content', 'my-events', 'GET', lambda i: (None, 'when=all', None, member_token(i))),
+            Scenario('content', 'event-detail', 'GET', lambda i: ({'pk': self.pick(self.event_ids, i)}, '', None, member_token(i))),
+            Scenario('content', 'content-search', 'GET', lambda i: (None, f'q={self.pick(WORDS, i)}', None, member_token(i))),
+            Scenario('content', 'event-waitlist', 'GET', lambda i: ({'pk': self.pick(self.event_ids, i)}, '', None, member_token(i))),
+            Scenario('content', 'event-registrations', 'GET', lambda i: ({'pk': self.pick(self.event_ids, i)}, '', None, staff)),
+            Scenario('content', 'export-event-registrations', 'GET',
+                     lambda i: ({'pk': self.pick(self.event_ids, i)}, 'stream=csv', None, staff)),
+            Scenario('content', 'admin-events-overview', 'GET', lambda i: (None, '', None, staff)),
+            Scenario('content', 'admin-users-list', 'GET', lambda i: (None, '', None, staff)),
+            Scenario('authentication', 'profile', 'GET', lambda i: (None, '', None, member_token(i))),
+            Scenario('authentication', 'admin-users-list', 'GET', lambda i: (None, '', None, staff)),
+            Scenario('authentication', 'token-verify', 'POST', lambda i: (None, '', {'token': member_token(i)}, None)),
+        ]
+        write = [
+            Scenario('authentication', 'login', 'POST',
+                     lambda i: (None, '', {'username': benchmark_username(1 + i % len(self.members)), 'password': DEFAULT_PASSWORD}, None),
+                     keep(self.refresh_tokens['login'], lambda i, body: body['tokens']['refresh']), hashing=True),
+            Scenario('authentication', 'register', 'POST',
+                     lambda i: (None, '', {
+                         'username': f'bench-new-{i}', 'email': f'bench-new-{i}@example.com',
+                         'password': DEFAULT_PASSWORD, 'password_confirm': DEFAULT_PASSWORD,
+                         'first_name': 'New', 'last_name': 'Member',
+                     }, None),
+                     keep(self.refresh_tokens['register'], lambda i, body: body['tokens']['refresh']), hashing=True),
+            Scenario('authentication', 'token-refresh', 'POST',
+                     lambda i: using(self.from_list(self.refresh_tokens['register'], i),
+                                     lambda token: (None, '', {'refresh': token}, None))),
+            Scenario('authentication', 'logout', 'POST',
+                     lambda i: using(self.from_list(self.refresh_tokens['login'], i),
+                                     lambda token: (None, '', {'refresh': token}, None))),
+            Scenario('authentication', 'profile', 'PUT', lambda i: (None, '', {'first_name': f'Member{i}'}, member_token(i))),
+            Scenario('content', 'news-list', 'POST',
+                     lambda i: (None, '', {'title': f'Benchmark article {i}', 'content': ' '.join(WORDS * 20), 'category': 'General'}, staff),
+                     keep(self.created['news'], lambda i, body: body['id'])),
+            Scenario('content', 'news-detail', 'PUT',
+                     lambda i: ({'pk': self.pick(self.news_ids, i)}, '', {'title': f'Edited article {i}'}, staff)),
+            Scenario('content', 'news-detail', 'DELETE',
+                     lambda i: using(self.from_list(self.created['news'], i), lambda pk: ({'pk': pk}, '', None, staff))),
+            Scenario('content', 'events-list', 'POST', lambda i: (None, '', new_event(i), staff),
+                     keep(self.created['events'], lambda i, body: body['id'])),
+            Scenario('content', 'event-detail', 'PUT',
+                     lambda i: using(self.from_list(self.created['events'], i),
+                                     lambda pk: ({'pk': pk}, '', {'capacity': 100 + i % 10}, staff))),
+            Scenario('content', 'event-register', 'POST',
+                     lambda i: using(self.pairs(self.open_event_ids, i), lambda pair: ({'pk': pair[1]}, '', None, pair[0][1])),
+                     keep_pair(self.registered, self.open_event_ids)),
+            Scenario('content', 'event-unregister', 'DELETE', lambda i: as_pair(self.registered, i)),
+            Scenario('content', 'event-waitlist', 'POST',
+                     lambda i: using(self.pairs(self.full_event_ids, i), lambda pair: ({'pk': pair[1]}, '', None, pair[0][1])),
+                     keep_pair(self.waitlisted, self.full_event_ids)),
+            Scenario('content', 'event-waitlist', 'DELETE', lambda i: as_pair(self.waitlisted, i)),
+            Scenario('content', 'bulk-event-registrations', 'POST',
+                     lambda i: using(bulk_chunk(i), lambda chunk: ({'pk': chunk[0]}, '', {'user_ids': chunk[1]}, staff)),
+                     keep(self.bulk_registered, lambda i, body: bulk_chunk(i))),
+            Scenario('content', 'remove-event-registration', 'DELETE',
+                     lambda i: using(self.from_list(self.bulk_registered, i),
+                                     lambda chunk: ({'pk': chunk[0], 'user_id': chunk[1][0]}, '', None, staff))),
+            Scenario('content', 'bulk-event-registrations', 'DELETE',
+                     lambda i: using(self.from_list(self.bulk_registered, i),
+                                     lambda chunk: ({'pk': chunk[0]}, '', {'user_ids': chunk[1]}, staff))),
+            Scenario('content', 'admin-update-permissions', 'PATCH',
+                     lambda i: ({'user_id': self.pick(self.user_ids, i)}, '', {'can_create_content': i % 2 == 0}, staff)),
+            Scenario('content', 'admin-update-avatar', 'PATCH',
+                     lambda i: ({'user_id': self.pick(self.user_ids, i)}, '', {'avatar_url': f'https://example.com/avatars/{i}.png'}, staff)),
+            Scenario('content', 'admin-delete-avatar', 'DELETE', lambda i: ({'user_id': self.pick(self.user_ids, i)}, '', None, staff)),
+            Scenario('authentication', 'admin-update-user', 'PATCH',
+                     lambda i: ({'user_id': self.pick(self.user_ids, i)}, '', {'can_create_content': i % 2 == 1}, staff)),
+            # Last, so the events created above served every scenario that needed them
+            Scenario('content', 'event-detail', 'DELETE',
+                     lambda i: using(self.from_list(self.created['events'], i), lambda pk: ({'pk': pk}, '', None, staff))),
+        ]
+        return read, write
+
+    def run_scenario(self, scenario, count, concurrency, warmup):
+        requests = []
+        for i in range(count):
+            spec = scenario.build(i)
+            if spec is None:
+                break
+            kwargs, query, body, token = spec
+            requests.append((i, self.url(scenario.app, scenario.route, kwargs, query), body, token))
+        if not requests:
+            return None
+
+        if scenario.method == 'GET':
+            for _, path, body, token in requests[:warmup]:
+                self.send('GET', path, token, body)
+
+        def measure(request):
+            i, path, body, token = request
+            return (i, *self.send(scenario.method, path, token, body))
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as executor:
+            results = list(executor.map(measure, requests))
+        wall = time.perf_counter() - start
+
+        if scenario.record:
+            for i, status, _, _, _, data in results:
+                scenario.record(i, status, data)
+
+        latencies = sorted(elapsed * 1000 for _, _, elapsed, _, _, _ in results)
+        queries = [count for _, _, _, count, _, _ in results if count is not None]
+        statuses = Counter(str(status) for _, status, _, _, _, _ in results)
+        return {
+            'route': f'{scenario.app}:{scenario.route}',
+            'method': scenario.method,
+            'path': requests[0][1],
+            'requests': len(results),
+            'errors': sum(1 for _, status, _, _, _, _ in results if status is None or status >= 500),
+            'status_codes': dict(sorted(statuses.items())),
+            'throughput_rps': round(len(results) / wall, 1),
+            'latency_ms': {
+                'p50': round(percentile(latencies, 0.50), 2),
+                'p95': round(percentile(latencies, 0.95), 2),
+                'p99': round(percentile(latencies, 0.99), 2),
+                'mean': round(sum(latencies) / len(latencies), 2),
+                'max': round(latencies[-1], 2),
+            },
+            'queries_per_request': {
+                'mean': round(sum(queries) / len(queries), 2) if queries else None,
+                'max': max(queries) if queries else None,
+            },
+            'bytes_per_response': round(sum(size for _, _, _, _, size, _ in results) / len(results)),
+        }
+
+    def uncovered_routes(self, scenarios):
+        """Routes in the app urlconfs that no scenario exercises"""
+        covered = {(scenario.app, scenario.route) for scenario in scenarios}
+        missing = []
+        for app in APP_PREFIXES:
+            for pattern in import_module(f'{app}.urls').urlpatterns:
+                if (app, pattern.name) not in covered:
+                    missing.append(f'{app}:{pattern.name}')
+        return missing
+
+    def handle(self, *args, **options):
+        workdir = tempfile.mkdtemp(prefix='benchmark-')
+        env = {
+            **os.environ,
+            'DATABASE_URL': options['database_url'] or f'sqlite:///{os.path.join(workdir, "benchmark.sqlite3")}',
+            'ASGI': 'True' if options['asgi'] else 'False',
+            'QUERY_COUNT_HEADER': 'True',
+            # A cache the workers share, which list and user caching require
+            'CACHE_DIR': os.environ.get('CACHE_DIR') or os.path.join(workdir, 'cache'),
+            'DEBUG': 'False',
+            'PYTHONUNBUFFERED': '1',
+        }
+        log_path = os.path.join(workdir, 'server.log')
+        server = None
+        try:
+            self.stderr.write('Migrating and seeding the benchmark database...')
+            self.manage(env, 'migrate', '--noinput')
+            self.manage(env, 'seed_benchmark_data', *[
+                f'--{option}={options[option]}' for option in ('users', 'news', 'events', 'registrations', 'seed')
+            ])
+
+            server, self.port = self.start_server(env, options['workers'], log_path)
+            self.local = threading.local()
+            self.prepare(options)
+            read, write = self.scenarios()
+
+            results = []
+            started = time.perf_counter()
+            # Reads go first so they see the seeded dataset, not the writes' leftovers
+            for scenario in read + write:
+                if options['route'] and scenario.route not in options['route']:
+                    continue
+                count = options['hashing_requests'] if scenario.hashing else options['requests']
+                result = self.run_scenario(scenario, count, options['concurrency'], options['warmup'])
+                if result is None:
+                    self.stderr.write(f'  {scenario.method} {scenario.app}:{scenario.route}: no inputs, skipped')
+                    continue
+                results.append(result)
+                self.stderr.write(
+                    f"  {result['method']:6} {result['route']:45} {result['throughput_rps']:8} req/s  "
+                    f"p50 {result['latency_ms']['p50']:8} ms  p99 {result['latency_ms']['p99']:8} ms  "
+                    f"{result['queries_per_request']['mean']} queries"
+                )
+            elapsed = time.perf_counter() - started
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait(timeout=30)
+            if options['keep']:
+                self.stderr.write(f'Database and server log kept in {workdir}')
+            else:
+                shutil.rmtree(workdir, ignore_errors=True)
+
+        total = sum(result['requests'] for result in results)
+        report = {
+            'commit': git_commit(),
+            'timestamp': timezone.now().isoformat(),
+            'python': sys.version.split()[0],
+            'django': django.get_version(),
+            'server': {'interface': 'asgi' if options['asgi'] else 'wsgi', 'workers': options['workers']},
+            'concurrency': options['concurrency'],
+            'dataset': {option: options[option] for option in ('users', 'news', 'events', 'registrations', 'seed')},
+            'totals': {
+                'requests': total,
+                'errors': sum(result['errors'] for result in results),
+                'seconds': round(elapsed, 2),
+                'throughput_rps': round(total / elapsed, 1) if elapsed else None,
+            },
+            'scenarios': results,
+            'uncovered_routes': self.uncovered_routes(read + write),
+        }
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                handle.write(output + '\n')
+            self.stderr.write(self.style.SUCCESS(f'Report written to {options["output"]}'))
+        else:
+            self.stdout.write(output)
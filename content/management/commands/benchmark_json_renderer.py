@@ -0,0 +1,105 @@
+import io
+import json
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from authentication.models import UserProfile
+from backend.fastjson import FastJSONParser, FastJSONRenderer, orjson
+from content.models import Event
+from content.serializers import EventSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare DRF's stdlib JSON renderer/parser with the orjson-backed ones on "
+        'a serialized EventSerializer payload. Uses in-memory events; no database rows are read.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=1000, help='Events in the payload (default: 1000)')
+        parser.add_argument('--repeat', type=int, default=20, help='Timed runs per case; the best is reported')
+        parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+
+    def payload(self, items):
+        """Serialized data for ``items`` unsaved events, shaped like a full events page"""
+        author = User(first_name='Event', last_name='Team', username='events')
+        UserProfile(user=author, avatar_url='https://example.com/avatar.png')
+        now = timezone.now()
+        events = [
+            Event(
+                pk=index,
+                title=f'Security Summit {index}',
+                description='Talks, workshops and networking for security professionals. ' * 20,
+                category='Conference',
+                image='https://example.com/event.jpg',
+                excerpt='Talks, workshops and networking for security professionals.',
+                date=now + timedelta(days=index),
+                location='Moscone Center',
+                venue_details='747 Howard St, San Francisco, CA 94103',
+                capacity=500,
+                registered=index % 500,
+                ticket_price=Decimal('199.00'),
+                agenda='09:00 Keynote\n10:30 Workshops\n13:00 Panels\n16:00 Networking',
+                contact_email='events@example.com',
+                author=author,
+                created_at=now,
+                updated_at=now,
+            )
+            for index in range(1, items + 1)
+        ]
+        return EventSerializer(events, many=True, context={'registered_event_ids': set()}).data
+
+    def best_of(self, repeat, func):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    def handle(self, *args, **options):
+        data = self.payload(options['items'])
+        repeat = options['repeat']
+        results = []
+
+        for label, renderer, parser in (
+            ('drf', JSONRenderer(), JSONParser()),
+            ('fast', FastJSONRenderer(), FastJSONParser()),
+        ):
+            body = renderer.render(data)
+            results.append({
+                'renderer': label,
+                'bytes': len(body),
+                'render_ms': round(self.best_of(repeat, lambda: renderer.render(data)) * 1000, 3),
+                'parse_ms': round(self.best_of(repeat, lambda: parser.parse(io.BytesIO(body))) * 1000, 3),
+            })
+
+        drf, fast = results
+        report = {
+            'items': options['items'],
+            'orjson': orjson is not None,
+            'results': results,
+            'render_speedup': round(drf['render_ms'] / fast['render_ms'], 1) if fast['render_ms'] else None,
+            'parse_speedup': round(drf['parse_ms'] / fast['parse_ms'], 1) if fast['parse_ms'] else None,
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        if not report['orjson']:
+            self.stdout.write(self.style.WARNING('orjson is not installed; the fast renderer is using the fallback'))
+        for result in results:
+            self.stdout.write(
+                f"{result['renderer']:>5}: render {result['render_ms']} ms, "
+                f"parse {result['parse_ms']} ms, {result['bytes']} bytes"
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"{options['items']} events: render {report['render_speedup']}x, parse {report['parse_speedup']}x faster"
+        ))
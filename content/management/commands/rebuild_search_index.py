@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from content.search import SQLITE_FTS_TABLES, sqlite_fts_triggers
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index over news and events'
+
+    def handle(self, *args, **options):
+        with connection.cursor() as cursor:
+            if connection.vendor == 'sqlite':
+                for table, fts, columns in SQLITE_FTS_TABLES:
+                    # Triggers are lost when a migration rebuilds the base table
+                    for statement in sqlite_fts_triggers(table, fts, columns):
+                        cursor.execute(statement)
+                    cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+            elif connection.vendor == 'postgresql':
+                for index in ('news_search_idx', 'event_search_idx'):
+                    cursor.execute(f'REINDEX INDEX {index}')
+            else:
+                self.stdout.write(f'No full-text index is used on {connection.vendor}')
+                return
+        self.stdout.write(self.style.SUCCESS('Search index rebuilt'))
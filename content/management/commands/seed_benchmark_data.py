@@ -0,0 +1,128 @@
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from authentication.models import UserProfile
+from content.models import News, Event, EventRegistration, EventWaitlistEntry
+
+USERNAME_PREFIX = 'bench-user-'
+DEFAULT_PASSWORD = 'bench-password'
+
+NEWS_CATEGORIES = ['General', 'Security', 'Technology', 'Community', 'Announcements']
+EVENT_CATEGORIES = ['Workshop', 'Conference', 'Meetup', 'Webinar', 'Training']
+WORDS = (
+    'security network threat cloud identity access policy audit incident response '
+    'compliance risk encryption training community member chapter speaker session '
+    'workshop panel keynote research vulnerability defense awareness governance'
+).split()
+
+
+def benchmark_username(index):
+    """Username of the index-th seeded user; user 0 is staff"""
+    return f'{USERNAME_PREFIX}{index:05d}'
+
+
+class Command(BaseCommand):
+    help = (
+        'Fill an empty database with a reproducible news/events/registrations dataset '
+        'for benchmark_endpoints. User 0 is staff; every seeded user has the same password.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=500)
+        parser.add_argument('--news', type=int, default=1000)
+        parser.add_argument('--events', type=int, default=300)
+        parser.add_argument('--registrations', type=int, default=40, help='Average registrations per event')
+        parser.add_argument('--words', type=int, default=600, help='Words per article / event description')
+        parser.add_argument('--password', default=DEFAULT_PASSWORD)
+        parser.add_argument('--seed', type=int, default=0, help='Random seed, so runs are comparable')
+
+    def text(self, rng, words):
+        return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        if options['users'] < 1:
+            raise CommandError('--users must be at least 1')
+        if User.objects.filter(username__startswith=USERNAME_PREFIX).exists():
+            raise CommandError('This database already holds benchmark data')
+
+        rng = random.Random(options['seed'])
+        now = timezone.now()
+        words = options['words']
+
+        # Hashing is deliberately slow; every seeded user shares one hash
+        password = make_password(options['password'])
+        User.objects.bulk_create([
+            User(
+                username=benchmark_username(index),
+                email=f'{benchmark_username(index)}@example.com',
+                first_name=f'Member{index}',
+                last_name='Bench',
+                password=password,
+                is_staff=index == 0,
+            )
+            for index in range(options['users'])
+        ])
+        users = list(User.objects.filter(username__startswith=USERNAME_PREFIX).order_by('username'))
+        UserProfile.objects.bulk_create([
+            UserProfile(user=user, can_create_content=index % 10 == 0, phone_number=f'+1555{index:07d}')
+            for index, user in enumerate(users)
+        ])
+        authors = users[::10]
+
+        News.objects.bulk_create([
+            News(
+                title=f'{self.text(rng, 6)[:-1]} {index}',
+                content=self.text(rng, words),
+                category=rng.choice(NEWS_CATEGORIES),
+                excerpt=self.text(rng, 25),
+                read_time=f'{max(1, words // 200)} min read',
+                views=rng.randint(0, 5000),
+                author=rng.choice(authors),
+            )
+            for index in range(options['news'])
+        ], batch_size=500)
+
+        Event.objects.bulk_create([
+            Event(
+                title=f'{self.text(rng, 4)[:-1]} {index}',
+                description=self.text(rng, words),
+                category=rng.choice(EVENT_CATEGORIES),
+                excerpt=self.text(rng, 25),
+                # A third of the events are in the past
+                date=now + timedelta(days=rng.randint(-90, 180), hours=rng.randint(8, 18)),
+                location=f'Hall {rng.randint(1, 20)}',
+                venue_details=f'{rng.randint(1, 999)} Main St, Room {rng.randint(100, 400)}',
+                capacity=rng.randint(options['registrations'], options['registrations'] * 3) or 1,
+                agenda='\n'.join(f'{9 + hour}:00 {self.text(rng, 5)}' for hour in range(6)),
+                contact_email='events@example.com',
+                author=rng.choice(authors),
+            )
+            for index in range(options['events'])
+        ], batch_size=500)
+
+        # Fill each event to a random level around the average, waitlisting the overflow
+        registrations, waitlist = [], []
+        for event in Event.objects.only('pk', 'capacity'):
+            wanted = min(len(users), rng.randint(0, options['registrations'] * 2))
+            attendees = rng.sample(users, wanted)
+            registrations += [
+                EventRegistration(event=event, user=user) for user in attendees[:event.capacity]
+            ]
+            waitlist += [
+                EventWaitlistEntry(event=event, user=user) for user in attendees[event.capacity:]
+            ]
+        EventRegistration.objects.bulk_create(registrations, batch_size=1000)
+        EventWaitlistEntry.objects.bulk_create(waitlist, batch_size=1000)
+        Event.objects.sync_registered()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {len(users)} users, {options["news"]} news, {options["events"]} events, '
+            f'{len(registrations)} registrations and {len(waitlist)} waitlist entries'
+        ))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db.models import F
+
+from content.models import Event
+
+
+class Command(BaseCommand):
+    help = 'Recompute Event.registered from EventRegistration rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Only report events whose counter has drifted')
+
+    def handle(self, *args, **options):
+        drifted = (
+            Event.objects.with_actual_registrations()
+            .exclude(registered=F('actual_registrations'))
+            .values_list('pk', 'title', 'registered', 'actual_registrations')
+        )
+        for pk, title, registered, actual in drifted:
+            self.stdout.write(f'Event {pk} "{title}": registered={registered}, actual={actual}')
+
+        if options['dry_run']:
+            return
+
+        updated = Event.objects.sync_registered()
+        self.stdout.write(self.style.SUCCESS(f'Recomputed registration counters for {updated} events'))
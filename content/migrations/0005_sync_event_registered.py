@@ -0,0 +1,27 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:02
+
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def sync_registered(apps, schema_editor):
+    # Event.registered was never maintained before; seed it from the real rows
+    Event = apps.get_model('content', 'Event')
+    EventRegistration = apps.get_model('content', 'EventRegistration')
+    counts = (
+        EventRegistration.objects.filter(event=OuterRef('pk'))
+        .order_by().values('event').annotate(total=Count('pk')).values('total')
+    )
+    Event.objects.update(registered=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0004_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(sync_registered, migrations.RunPython.noop),
+    ]
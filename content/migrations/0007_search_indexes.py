@@ -0,0 +1,81 @@
+# Generated by Django 4.2.7 on 2026-10-18 12:10
+
+from django.db import migrations
+
+# (table, fts table, indexed columns)
+SQLITE_FTS_TABLES = [
+    ('content_news', 'content_news_fts', ['title', 'content', 'excerpt']),
+    ('content_event', 'content_event_fts', ['title', 'description', 'location']),
+]
+
+# Must match NEWS_VECTOR / EVENT_VECTOR in content/search.py
+POSTGRESQL_INDEXES = [
+    ('content_news', 'news_search_idx', (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(excerpt, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(content, '')), 'C')"
+    )),
+    ('content_event', 'event_search_idx', (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(location, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+    )),
+]
+
+
+def create_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        # External-content FTS5 tables kept in sync by triggers. SQLite drops
+        # triggers when a later migration rebuilds the base table; the
+        # post_migrate handler in content/search.py puts them back.
+        for table, fts, columns in SQLITE_FTS_TABLES:
+            cols = ', '.join(columns)
+            new = ', '.join(f'new.{column}' for column in columns)
+            old = ', '.join(f'old.{column}' for column in columns)
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table}', "
+                f"content_rowid='id', tokenize='porter unicode61')"
+            )
+            schema_editor.execute(
+                f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+                f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END"
+            )
+            schema_editor.execute(
+                f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); END"
+            )
+            # Only text edits touch the index, not view or registration counters
+            schema_editor.execute(
+                f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+                f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END"
+            )
+            schema_editor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+    elif vendor == 'postgresql':
+        # Expression indexes stay current on every write without extra columns
+        for table, index, vector in POSTGRESQL_INDEXES:
+            schema_editor.execute(f"CREATE INDEX {index} ON {table} USING GIN (({vector}))")
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        for table, fts, columns in SQLITE_FTS_TABLES:
+            for suffix in ('ai', 'ad', 'au'):
+                schema_editor.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+            schema_editor.execute(f"DROP TABLE IF EXISTS {fts}")
+    elif vendor == 'postgresql':
+        for table, index, vector in POSTGRESQL_INDEXES:
+            schema_editor.execute(f"DROP INDEX IF EXISTS {index}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0006_eventwaitlistentry'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0007_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['category', 'date'], name='event_category_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['event', '-registered_at'], name='registration_event_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['user', '-registered_at'], name='registration_user_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventwaitlistentry',
+            index=models.Index(fields=['event', 'joined_at', 'id'], name='waitlist_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['category', '-created_at'], name='news_category_created_idx'),
+        ),
+    ]
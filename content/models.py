@@ -1,5 +1,10 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import BooleanField, Case, Count, ExpressionWrapper, F, FloatField, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce, Greatest
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
 from django.contrib.auth.models import User
+from .cache import invalidate_list_cache
 
 class News(models.Model):
     title = models.CharField(max_length=200)
@@ -16,6 +21,11 @@ class News(models.Model):
     class Meta:
         ordering = ['-created_at']
         verbose_name_plural = "News"
+        indexes = [
+            # Keyset pagination seeks on (created_at, id)
+            models.Index(fields=['-created_at', '-id'], name='news_created_id_idx'),
+            models.Index(fields=['category', '-created_at'], name='news_category_created_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -25,6 +35,153 @@ class News(models.Model):
             self.excerpt = self.content[:150] + '...' if len(self.content) > 150 else self.content
         super().save(*args, **kwargs)
 
+class EventQuerySet(models.QuerySet):
+    def claim_spots(self, pk, count=1):
+        """
+        Atomically add ``count`` to Event.registered if capacity allows.
+
+        The capacity check and the increment are one conditional UPDATE, so
+        concurrent sign-ups cannot overbook. Returns True if the spots were taken.
+        """
+        claimed = self.filter(pk=pk, registered__lte=F('capacity') - count).update(
+            registered=F('registered') + count
+        ) == 1
+        if claimed:
+            # The lists show each event's registration count
+            transaction.on_commit(lambda: invalidate_list_cache('events'))
+        return claimed
+
+    def release_spots(self, pk, count=1):
+        """Give back ``count`` spots after deleting that many of the event's registrations"""
+        self.filter(pk=pk).update(registered=Greatest(F('registered') - count, 0))
+        transaction.on_commit(lambda: invalidate_list_cache('events'))
+
+    def promote_waitlist(self, pk):
+        """
+        Fill the event's free spots from the head of its waitlist.
+
+        The event row is locked for the duration, so promotions and direct
+        sign-ups through claim_spots cannot both take the same spot. Returns
+        the ids of the promoted users.
+        """
+        with transaction.atomic():
+            event = self.select_for_update().filter(pk=pk).first()
+            if event is None or event.registered >= event.capacity:
+                return []
+            # Entries of users who registered some other way are stale; drop them
+            # rather than promote them into a duplicate registration
+            EventWaitlistEntry.objects.filter(
+                event_id=pk, user_id__in=EventRegistration.objects.filter(event_id=pk).values('user_id')
+            ).delete()
+            entries = list(
+                EventWaitlistEntry.objects.filter(event_id=pk)[:event.capacity - event.registered]
+            )
+            if not entries:
+                return []
+            EventRegistration.objects.bulk_create(
+                [EventRegistration(event_id=pk, user_id=entry.user_id) for entry in entries]
+            )
+            EventWaitlistEntry.objects.filter(pk__in=[entry.pk for entry in entries]).delete()
+            self.filter(pk=pk).update(registered=F('registered') + len(entries))
+            # bulk_create sends no post_save, so invalidate the cached event lists here
+            transaction.on_commit(lambda: invalidate_list_cache('events'))
+            return [entry.user_id for entry in entries]
+
+    def register_users(self, pk, user_ids):
+        """
+        Register many users for an event at once, as far as capacity allows.
+
+        Capacity is checked once under the event row lock, and the new rows go
+        in with one bulk INSERT. Returns {user_id: status}, where status is
+        'registered', 'already_registered', 'user_not_found' or 'event_full'.
+        """
+        with transaction.atomic():
+            event = self.select_for_update().get(pk=pk)
+            known = set(User.objects.filter(pk__in=user_ids).values_list('pk', flat=True))
+            already = set(
+                EventRegistration.objects.filter(event_id=pk, user_id__in=known)
+                .order_by().values_list('user_id', flat=True)
+            )
+
+            results, candidates = {}, []
+            for user_id in user_ids:
+                if user_id not in known:
+                    results[user_id] = 'user_not_found'
+                elif user_id in already:
+                    results[user_id] = 'already_registered'
+                else:
+                    candidates.append(user_id)
+
+            free = max(0, event.capacity - event.registered)
+            added = candidates[:free]
+            for user_id in candidates[free:]:
+                results[user_id] = 'event_full'
+
+            if added:
+                # The row lock keeps other sign-ups out, so every row here is new
+                EventRegistration.objects.bulk_create(
+                    [EventRegistration(event_id=pk, user_id=user_id) for user_id in added],
+                    ignore_conflicts=True,
+                )
+                self.filter(pk=pk).update(registered=F('registered') + len(added))
+                EventWaitlistEntry.objects.filter(event_id=pk, user_id__in=added).delete()
+                transaction.on_commit(lambda: invalidate_list_cache('events'))
+            for user_id in added:
+                results[user_id] = 'registered'
+            return results
+
+    def unregister_users(self, pk, user_ids):
+        """
+        Remove many users' registrations with one DELETE and refill from the waitlist.
+
+        Returns {user_id: status}, where status is 'removed' or 'not_registered'.
+        """
+        with transaction.atomic():
+            self.select_for_update().filter(pk=pk).first()
+            registrations = EventRegistration.objects.filter(event_id=pk, user_id__in=user_ids)
+            removed = set(registrations.order_by().values_list('user_id', flat=True))
+            if removed:
+                # Nothing cascades from or listens to a registration delete, so this is one DELETE
+                deleted, _ = registrations.delete()
+                self.release_spots(pk, deleted)
+                self.promote_waitlist(pk)
+            return {user_id: 'removed' if user_id in removed else 'not_registered' for user_id in user_ids}
+
+    def with_registration_stats(self):
+        """Annotate registration_full and registration_percentage from the counter columns"""
+        return self.annotate(
+            registration_full=Case(
+                When(registered__gte=F('capacity'), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+            registration_percentage=Case(
+                When(capacity__gt=0, then=ExpressionWrapper(
+                    F('registered') * 100.0 / F('capacity'), output_field=FloatField()
+                )),
+                default=Value(0.0),
+                output_field=FloatField(),
+            ),
+        )
+
+    def with_actual_registrations(self):
+        """Annotate actual_registrations, counted from EventRegistration rows"""
+        counts = (
+            EventRegistration.objects.filter(event=OuterRef('pk'))
+            .order_by().values('event').annotate(total=Count('pk')).values('total')
+        )
+        return self.annotate(actual_registrations=Coalesce(Subquery(counts), 0))
+
+    def sync_registered(self):
+        """Recompute Event.registered from EventRegistration in one UPDATE"""
+        counts = (
+            EventRegistration.objects.filter(event=OuterRef('pk'))
+            .order_by().values('event').annotate(total=Count('pk')).values('total')
+        )
+        updated = self.update(registered=Coalesce(Subquery(counts), 0))
+        invalidate_list_cache('events')
+        return updated
+
 class Event(models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField()
@@ -43,8 +200,16 @@ class Event(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = EventQuerySet.as_manager()
+
     class Meta:
         ordering = ['date']
+        indexes = [
+            # Keyset pagination seeks on (date, id)
+            models.Index(fields=['date', 'id'], name='event_date_id_idx'),
+            # Category-first filters ordered by date (admin overview, calendar)
+            models.Index(fields=['category', 'date'], name='event_category_date_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -58,7 +223,10 @@ class Event(models.Model):
 
     @property
     def current_registrations(self):
-        return self.registrations.count()
+        # Maintained by the EventQuerySet methods that add and remove
+        # registrations, and release_deleted_users_spots; sync_registered
+        # recomputes it for rows written any other way
+        return self.registered
     
     @property
     def is_full(self):
@@ -76,6 +244,50 @@ class EventRegistration(models.Model):
     class Meta:
         unique_together = ('event', 'user')  # Prevent duplicate registrations
         ordering = ['-registered_at']
+        indexes = [
+            # An event's roster and a user's registrations, newest first
+            models.Index(fields=['event', '-registered_at'], name='registration_event_time_idx'),
+            models.Index(fields=['user', '-registered_at'], name='registration_user_time_idx'),
+        ]
         
     def __str__(self):
-        return f"{self.user.username} - {self.event.title}"
\ No newline at end of file
+        return f"{self.user.username} - {self.event.title}"
+
+class EventWaitlistEntry(models.Model):
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='waitlist_entries')
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    joined_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('event', 'user')
+        ordering = ['joined_at', 'id']  # First come, first promoted
+        indexes = [
+            models.Index(fields=['event', 'joined_at', 'id'], name='waitlist_queue_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} waiting for {self.event.title}"
+
+    @property
+    def position(self):
+        """1-based place in the event's queue"""
+        return EventWaitlistEntry.objects.filter(event_id=self.event_id).filter(
+            models.Q(joined_at__lt=self.joined_at) | models.Q(joined_at=self.joined_at, id__lt=self.id)
+        ).count() + 1
+
+@receiver(pre_delete, sender=User)
+def release_deleted_users_spots(sender, instance, **kwargs):
+    """Give back the spots of a user whose registrations are about to cascade away"""
+    # One UPDATE for all their events; a user holds at most one spot per event.
+    # Registrations have no delete receivers, so the cascade itself stays a single DELETE
+    if Event.objects.filter(registrations__user=instance).update(registered=Greatest(F('registered') - 1, 0)):
+        transaction.on_commit(lambda: invalidate_list_cache('events'))
+
+@receiver([post_save, post_delete], sender=News)
+def invalidate_news_lists(sender, **kwargs):
+    transaction.on_commit(lambda: invalidate_list_cache('news'))
+
+@receiver([post_save, post_delete], sender=Event)
+def invalidate_event_lists(sender, **kwargs):
+    # Registration changes go through the EventQuerySet methods, which invalidate themselves
+    transaction.on_commit(lambda: invalidate_list_cache('events'))
@@ -0,0 +1,110 @@
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a cursor we did not issue"""
+
+
+def encode_cursor(value, pk):
+    """Pack the last row's sort key into an opaque, URL-safe cursor"""
+    payload = json.dumps([value.isoformat(), pk], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Unpack a cursor produced by encode_cursor into (datetime, pk)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        value, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        parsed = parse_datetime(value)
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidCursor(cursor)
+    if parsed is None or not isinstance(pk, int):
+        raise InvalidCursor(cursor)
+    return parsed, pk
+
+
+def get_page_size(request, default=None):
+    """Read ?page_size=, falling back to CONTENT_PAGE_SIZE and capped at CONTENT_MAX_PAGE_SIZE"""
+    maximum = getattr(settings, 'CONTENT_MAX_PAGE_SIZE', 100)
+    if default is None:
+        default = getattr(settings, 'CONTENT_PAGE_SIZE', 10)
+    try:
+        page_size = int(request.query_params.get('page_size', default))
+    except (TypeError, ValueError):
+        return default
+    return min(max(page_size, 1), maximum)
+
+
+def _keyset_page(request, queryset, key, descending, default_page_size):
+    """Order and seek ``queryset`` for the requested page; returns (queryset, page_size)"""
+    page_size = get_page_size(request, default_page_size)
+    direction = '-' if descending else ''
+    queryset = queryset.order_by(f'{direction}{key}', f'{direction}id')
+
+    cursor = request.query_params.get('cursor')
+    if cursor:
+        value, pk = decode_cursor(cursor)
+        if descending:
+            queryset = queryset.filter(Q(**{f'{key}__lte': value}) & (Q(**{f'{key}__lt': value}) | Q(id__lt=pk)))
+        else:
+            queryset = queryset.filter(Q(**{f'{key}__gte': value}) & (Q(**{f'{key}__gt': value}) | Q(id__gt=pk)))
+
+    # Fetch one extra row to find out whether there is a next page
+    return queryset[:page_size + 1], page_size
+
+
+def _split_page(items, key, page_size):
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        last = items[-1]
+        if isinstance(last, dict):  # .values() querysets
+            next_cursor = encode_cursor(last[key], last['id'])
+        else:
+            next_cursor = encode_cursor(getattr(last, key), last.pk)
+    return items, next_cursor
+
+
+def paginate_keyset(request, queryset, key, descending=False, default_page_size=None):
+    """
+    Return one page of ``queryset`` ordered by ``(key, id)`` and the cursor of the next page.
+
+    Seeking past the previous page's last row instead of using OFFSET keeps every
+    page an index range scan, so page 1,000 costs the same as page 1.
+    """
+    queryset, page_size = _keyset_page(request, queryset, key, descending, default_page_size)
+    return _split_page(list(queryset), key, page_size)
+
+
+async def apaginate_keyset(request, queryset, key, descending=False, default_page_size=None):
+    """Async version of paginate_keyset"""
+    queryset, page_size = _keyset_page(request, queryset, key, descending, default_page_size)
+    return _split_page([item async for item in queryset], key, page_size)
+
+
+def next_page_headers(request, next_cursor, param='cursor'):
+    """Link (and X-Next-Cursor) headers pointing at the next page, if there is one"""
+    headers = {}
+    if next_cursor:
+        next_url = replace_query_param(request.build_absolute_uri(), param, next_cursor)
+        headers['Link'] = f'<{next_url}>; rel="next"'
+        if param == 'cursor':
+            headers['X-Next-Cursor'] = next_cursor
+    return headers
+
+
+def paginated_response(request, data, next_cursor, param='cursor'):
+    """
+    Return the page body as a plain list and advertise the next page in headers,
+    so existing clients that expect an array keep working.
+    """
+    return Response(data, headers=next_page_headers(request, next_cursor, param))
@@ -0,0 +1,141 @@
+import re
+
+from django.db import connection, connections
+from django.db.models import Q
+
+from .models import News, Event
+
+# Weighted document vectors; these must match the GIN expression indexes in
+# migration 0007 exactly or PostgreSQL will not use them
+NEWS_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(excerpt, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'C')"
+)
+EVENT_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(location, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+# (table, FTS5 table, indexed columns) for SQLite, as created by migration 0007
+SQLITE_FTS_TABLES = [
+    ('content_news', 'content_news_fts', ['title', 'content', 'excerpt']),
+    ('content_event', 'content_event_fts', ['title', 'description', 'location']),
+]
+
+SEARCH_TYPES = ('news', 'events')
+
+
+def sqlite_fts_triggers(table, fts, columns):
+    """Statements that (re)create the triggers keeping ``fts`` in sync with ``table``"""
+    cols = ', '.join(columns)
+    new = ', '.join(f'new.{column}' for column in columns)
+    old = ', '.join(f'old.{column}' for column in columns)
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+    ]
+
+
+def restore_sqlite_fts_triggers(using='default', **kwargs):
+    """
+    post_migrate handler: SQLite drops a table's triggers when a migration
+    rebuilds it, so recreate any missing ones and resync that index.
+    """
+    db = connections[using]
+    if db.vendor != 'sqlite':
+        return
+    with db.cursor() as cursor:
+        cursor.execute("SELECT type, name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+        existing = set(cursor.fetchall())
+        for table, fts, columns in SQLITE_FTS_TABLES:
+            if ('table', fts) not in existing:
+                continue  # migrated back past 0007
+            if all(('trigger', f'{fts}_{suffix}') in existing for suffix in ('ai', 'ad', 'au')):
+                continue
+            for statement in sqlite_fts_triggers(table, fts, columns):
+                cursor.execute(statement)
+            cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def fts5_query(text):
+    """Turn free text into an FTS5 query: every word must match, as a prefix"""
+    terms = re.findall(r'\w+', text)
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def _sqlite_hits(text, types, limit, offset):
+    match = fts5_query(text)
+    if not match:
+        return []
+    selects, params = [], []
+    # bm25() is lower-is-better; weights are per column in table order
+    if 'news' in types:
+        selects.append(
+            "SELECT 'news', rowid, bm25(content_news_fts, 10.0, 1.0, 4.0) AS rank "
+            "FROM content_news_fts WHERE content_news_fts MATCH %s"
+        )
+        params.append(match)
+    if 'events' in types:
+        selects.append(
+            "SELECT 'events', rowid, bm25(content_event_fts, 10.0, 1.0, 4.0) AS rank "
+            "FROM content_event_fts WHERE content_event_fts MATCH %s"
+        )
+        params.append(match)
+    sql = ' UNION ALL '.join(selects) + ' ORDER BY rank LIMIT %s OFFSET %s'
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params + [limit, offset])
+        return [(kind, pk, -rank) for kind, pk, rank in cursor.fetchall()]
+
+
+def _postgresql_hits(text, types, limit, offset):
+    selects, params = [], []
+    if 'news' in types:
+        selects.append(
+            f"SELECT 'news', id, ts_rank({NEWS_VECTOR}, query) AS rank "
+            f"FROM content_news, websearch_to_tsquery('english', %s) query "
+            f"WHERE {NEWS_VECTOR} @@ query"
+        )
+        params.append(text)
+    if 'events' in types:
+        selects.append(
+            f"SELECT 'events', id, ts_rank({EVENT_VECTOR}, query) AS rank "
+            f"FROM content_event, websearch_to_tsquery('english', %s) query "
+            f"WHERE {EVENT_VECTOR} @@ query"
+        )
+        params.append(text)
+    sql = ' UNION ALL '.join(selects) + ' ORDER BY rank DESC LIMIT %s OFFSET %s'
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params + [limit, offset])
+        return cursor.fetchall()
+
+
+def _fallback_hits(text, types, limit, offset):
+    # Unindexed, unranked substring match for databases without a full-text engine
+    hits = []
+    if 'news' in types:
+        matches = Q(title__icontains=text) | Q(content__icontains=text) | Q(excerpt__icontains=text)
+        hits += [('news', pk, 0.0) for pk in News.objects.filter(matches).values_list('pk', flat=True)[:offset + limit]]
+    if 'events' in types:
+        matches = Q(title__icontains=text) | Q(description__icontains=text) | Q(location__icontains=text)
+        hits += [('events', pk, 0.0) for pk in Event.objects.filter(matches).values_list('pk', flat=True)[:offset + limit]]
+    return hits[offset:offset + limit]
+
+
+def search_content(text, types=SEARCH_TYPES, limit=10, offset=0):
+    """
+    Rank News and Event rows against ``text`` using the database's full-text index.
+
+    Returns (type, pk, rank) tuples, best match first.
+    """
+    if connection.vendor == 'sqlite':
+        return _sqlite_hits(text, types, limit, offset)
+    if connection.vendor == 'postgresql':
+        return _postgresql_hits(text, types, limit, offset)
+    return _fallback_hits(text, types, limit, offset)
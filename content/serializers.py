@@ -1,12 +1,70 @@
 from rest_framework import serializers
 from .models import News, Event, EventRegistration
+from .counters import news_view_counter
 from django.contrib.auth.models import User
 
-class NewsSerializer(serializers.ModelSerializer):
+class InvalidFieldset(ValueError):
+    pass
+
+class SparseFieldsetMixin:
+    """
+    Lets callers trim the representation: ``fields`` keeps only the named
+    fields and ``omit`` drops the named ones. Dropped fields are removed before
+    serialization, so their SerializerMethodFields never run.
+
+    ``Meta.list_fields`` is the compact shape list endpoints send by default and
+    ``Meta.large_fields`` the columns worth deferring when they are not sent.
+    """
+
+    def __init__(self, *args, fields=None, omit=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        keep = self.field_names(fields, omit)
+        for name in list(self.fields):
+            if name not in keep:
+                self.fields.pop(name)
+
+    @classmethod
+    def field_names(cls, fields=None, omit=None):
+        """Names of the fields rendered for this fieldset, in Meta order"""
+        return [
+            name for name in cls.Meta.fields
+            if (fields is None or name in fields) and name not in (omit or ())
+        ]
+
+    @classmethod
+    def deferred_fields(cls, fields=None, omit=None):
+        """Large model columns the fieldset leaves out, for QuerySet.defer()"""
+        names = cls.field_names(fields, omit)
+        return [name for name in cls.Meta.large_fields if name not in names]
+
+    @classmethod
+    def fieldset(cls, request, default=None):
+        """
+        ``fields`` / ``omit`` kwargs from ?fields= and ?omit=. Without ?fields=
+        the ``default`` field list is used; ?fields=all sends every field.
+        The id is always kept so clients can link to the detail view.
+        """
+        fields = default
+        requested = request.query_params.get('fields')
+        if requested == 'all':
+            fields = None
+        elif requested:
+            fields = [name.strip() for name in requested.split(',') if name.strip()]
+        omit = [name.strip() for name in request.query_params.get('omit', '').split(',') if name.strip()]
+
+        unknown = sorted(set(fields or ()).union(omit).difference(cls.Meta.fields))
+        if unknown:
+            raise InvalidFieldset(f"Unknown fields: {', '.join(unknown)}")
+        if fields is not None and 'id' not in fields:
+            fields = ['id'] + list(fields)
+        return {'fields': fields, 'omit': [name for name in omit if name != 'id']}
+
+class NewsSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     author_name = serializers.SerializerMethodField()
     author_role = serializers.SerializerMethodField()
     author_avatar = serializers.SerializerMethodField()
     tags = serializers.SerializerMethodField()
+    views = serializers.SerializerMethodField()
 
     class Meta:
         model = News
@@ -14,6 +72,9 @@ class NewsSerializer(serializers.ModelSerializer):
                  'views', 'author', 'author_name', 'author_role', 'author_avatar', 'tags',
                  'created_at', 'updated_at']
         read_only_fields = ['author', 'excerpt', 'read_time', 'views', 'created_at', 'updated_at']
+        list_fields = ['id', 'title', 'category', 'image', 'excerpt', 'read_time', 'views',
+                      'author', 'author_name', 'created_at']
+        large_fields = ['content']
 
     def get_author_name(self, obj):
         return f"{obj.author.first_name} {obj.author.last_name}" if obj.author.first_name else obj.author.username
@@ -33,13 +94,17 @@ class NewsSerializer(serializers.ModelSerializer):
     def get_tags(self, obj):
         return ["News", obj.category]
 
+    def get_views(self, obj):
+        # Include views this worker has counted but not flushed yet
+        return obj.views + news_view_counter.pending(obj.pk)
+
     def create(self, validated_data):
         word_count = len(validated_data['content'].split())
         read_time = max(1, word_count // 200)
         validated_data['read_time'] = f"{read_time} min read"
         return super().create(validated_data)
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     author_name = serializers.SerializerMethodField()
     author_avatar = serializers.SerializerMethodField()
     end_date = serializers.DateTimeField(required=False, allow_null=True)
@@ -60,6 +125,10 @@ class EventSerializer(serializers.ModelSerializer):
                  'created_at', 'updated_at']
         read_only_fields = ['author', 'excerpt', 'registered', 'created_at', 'updated_at',
                            'is_registered', 'current_registrations', 'is_full', 'available_spots']
+        list_fields = ['id', 'title', 'category', 'image', 'excerpt', 'date', 'end_date', 'location',
+                      'capacity', 'registered', 'ticket_price', 'author_name',
+                      'is_registered', 'current_registrations', 'is_full', 'available_spots']
+        large_fields = ['description', 'venue_details', 'agenda']
 
     def get_author_name(self, obj):
         return f"{obj.author.first_name} {obj.author.last_name}" if obj.author.first_name else obj.author.username
@@ -73,6 +142,10 @@ class EventSerializer(serializers.ModelSerializer):
         return []
 
     def get_is_registered(self, obj):
+        # Views that serialize many events resolve the user's registrations up front
+        registered_event_ids = self.context.get('registered_event_ids')
+        if registered_event_ids is not None:
+            return obj.pk in registered_event_ids
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return EventRegistration.objects.filter(event=obj, user=request.user).exists()
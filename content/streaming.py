@@ -0,0 +1,137 @@
+import csv
+
+from django.http import StreamingHttpResponse
+
+from backend.fastjson import dumps
+
+# Rows fetched per database round trip and written per response chunk
+STREAM_CHUNK_SIZE = 2000
+
+STREAM_FORMATS = {
+    'json': 'application/json',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+class _Echo:
+    """File-like object whose write() hands the line back to csv.writer's caller"""
+
+    def write(self, value):
+        return value
+
+
+class _JSONBody:
+    """The pieces of a JSON array or NDJSON body, built one batch of rows at a time"""
+
+    def __init__(self, ndjson):
+        self.ndjson = ndjson
+        self.separator = '\n' if ndjson else ','
+        self.first = True
+
+    def head(self):
+        return '' if self.ndjson else '['
+
+    def batch(self, rows):
+        # Same encoder as the API's renderer, so dates look like the non-streamed API
+        text = ('' if self.first else self.separator) + self.separator.join(dumps(row).decode() for row in rows)
+        self.first = False
+        return text
+
+    def tail(self):
+        if self.ndjson:
+            return '' if self.first else '\n'
+        return ']'
+
+
+class _CSVBody:
+    """The pieces of a CSV body with a header row, built one batch of rows at a time"""
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.writer = csv.writer(_Echo())
+
+    def head(self):
+        return self.writer.writerow(self.columns)
+
+    def batch(self, rows):
+        return ''.join(self.writer.writerow([row[column] for column in self.columns]) for row in rows)
+
+    def tail(self):
+        return ''
+
+
+def _iter_body(body, rows, chunk_size):
+    """Yield ``body``'s pieces for ``rows``, one string per ``chunk_size`` rows"""
+    if head := body.head():
+        yield head
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= chunk_size:
+            yield body.batch(batch)
+            batch = []
+    if batch:
+        yield body.batch(batch)
+    if tail := body.tail():
+        yield tail
+
+
+async def _aiter_body(body, rows, chunk_size):
+    """Async version of _iter_body for an async iterable of rows"""
+    if head := body.head():
+        yield head
+    batch = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= chunk_size:
+            yield body.batch(batch)
+            batch = []
+    if batch:
+        yield body.batch(batch)
+    if tail := body.tail():
+        yield tail
+
+
+def iter_json(rows, ndjson=False, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Encode ``rows`` (an iterable of dicts) as a JSON array or as NDJSON,
+    yielding one string per ``chunk_size`` rows so memory stays flat.
+    """
+    return _iter_body(_JSONBody(ndjson), rows, chunk_size)
+
+
+def aiter_json(rows, ndjson=False, chunk_size=STREAM_CHUNK_SIZE):
+    """iter_json for an async iterable of rows, e.g. one built on QuerySet.aiterator()"""
+    return _aiter_body(_JSONBody(ndjson), rows, chunk_size)
+
+
+def streaming_json_response(rows, stream_format, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Stream ``rows`` as ``stream_format`` ('json' or 'ndjson').
+
+    Pass an async iterable under ASGI: Django reads a sync iterator into a
+    list before sending anything there.
+    """
+    encode = aiter_json if hasattr(rows, '__aiter__') else iter_json
+    return StreamingHttpResponse(
+        encode(rows, ndjson=stream_format == 'ndjson', chunk_size=chunk_size),
+        content_type=STREAM_FORMATS[stream_format],
+    )
+
+
+def iter_csv(rows, columns, chunk_size=STREAM_CHUNK_SIZE):
+    """Encode ``rows`` (an iterable of dicts) as CSV with a header, ``chunk_size`` rows per string"""
+    return _iter_body(_CSVBody(columns), rows, chunk_size)
+
+
+def aiter_csv(rows, columns, chunk_size=STREAM_CHUNK_SIZE):
+    """iter_csv for an async iterable of rows"""
+    return _aiter_body(_CSVBody(columns), rows, chunk_size)
+
+
+def streaming_csv_response(rows, columns, filename, chunk_size=STREAM_CHUNK_SIZE):
+    """Stream ``rows`` as a CSV download; async iterables as in streaming_json_response"""
+    encode = aiter_csv if hasattr(rows, '__aiter__') else iter_csv
+    response = StreamingHttpResponse(encode(rows, columns, chunk_size), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
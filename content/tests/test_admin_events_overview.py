@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from content.models import Event
+
+from .utils import ContentTestCase
+
+
+class AdminEventsOverviewTests(ContentTestCase):
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        for index in range(6):
+            event = self.create_event(
+                date=now + timedelta(days=index), capacity=3 if index else 0, category='A' if index % 2 else 'B'
+            )
+            Event.objects.filter(pk=event.pk).update(registered=index % 4)
+        self.now = now
+
+    def test_stats_come_from_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.admin.get('/api/content/admin/events/')
+        data = response.json()
+        self.assertEqual(len(data), 6)
+        self.assertEqual([event['current_registrations'] for event in data], [0, 1, 2, 3, 0, 1])
+        self.assertEqual([event['is_full'] for event in data], [True, False, False, True, False, False])
+        # Zero capacity reports 0% rather than dividing by zero
+        self.assertEqual([event['registration_percentage'] for event in data], [0, 33.3, 66.7, 100.0, 0, 33.3])
+
+    def test_filters_and_paging(self):
+        self.assertEqual(len(self.admin.get('/api/content/admin/events/?category=A').json()), 3)
+        day = (self.now + timedelta(days=2)).date().isoformat()
+        self.assertEqual(len(self.admin.get(f'/api/content/admin/events/?start={day}&end={day}').json()), 1)
+        response = self.admin.get('/api/content/admin/events/?page_size=4')
+        self.assertEqual(len(response.json()), 4)
+        self.assertIn('cursor=', response['Link'])
+        self.assertEqual(self.admin.get('/api/content/admin/events/?start=garbage').status_code, 400)
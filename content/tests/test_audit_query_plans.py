@@ -0,0 +1,30 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from content.counters import news_view_counter
+from content.models import News
+
+from .utils import ContentTestCase
+
+
+class AuditQueryPlansTests(ContentTestCase):
+    def test_audit_leaves_no_writes_behind(self):
+        news = News.objects.create(title='News', content='c', author=self.staff)
+        self.create_event()
+        stdout = StringIO()
+        call_command('audit_query_plans', username='staff', stdout=stdout)
+        self.assertIn('news detail', stdout.getvalue())
+        self.assertIn('across 13 endpoints', stdout.getvalue())
+        # The news detail view counted a view; it must not reach the database later
+        self.assertEqual(news_view_counter.pending(news.pk), 0)
+        news_view_counter.flush()
+        news.refresh_from_db()
+        self.assertEqual(news.views, 0)
+
+    def test_pending_views_from_before_the_run_are_kept(self):
+        news = News.objects.create(title='News', content='c', author=self.staff)
+        news_view_counter.record(news.pk, 2)
+        call_command('audit_query_plans', username='staff', stdout=StringIO())
+        news.refresh_from_db()
+        self.assertEqual(news.views, 2)
@@ -0,0 +1,21 @@
+from django.test import SimpleTestCase
+
+from content.management.commands.benchmark_endpoints import percentile
+
+
+class PercentileTests(SimpleTestCase):
+    def test_nearest_rank(self):
+        ordered = list(range(1, 11))
+        self.assertEqual(percentile(ordered, 0.5), 5)
+        self.assertEqual(percentile(ordered, 0.7), 7)
+        self.assertEqual(percentile(ordered, 0.9), 9)
+        self.assertEqual(percentile(ordered, 0.95), 10)
+        self.assertEqual(percentile(ordered, 0.99), 10)
+        self.assertEqual(percentile(ordered, 0), 1)
+        self.assertEqual(percentile(ordered, 1), 10)
+
+    def test_small_samples(self):
+        self.assertIsNone(percentile([], 0.5))
+        self.assertEqual(percentile([3.2], 0.99), 3.2)
+        self.assertEqual(percentile([1, 2], 0.5), 1)
+        self.assertEqual(percentile([1, 2], 0.51), 2)
@@ -0,0 +1,54 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from content.models import Event, EventRegistration, EventWaitlistEntry
+
+from .utils import ContentTestCase, client_for
+
+
+class BulkRegistrationTests(ContentTestCase):
+    def test_bulk_register_and_remove(self):
+        event = self.create_event(capacity=5)
+        users = self.create_users(8)
+        ids = [user.pk for user in users]
+        Event.objects.register_users(event.pk, [ids[0]])
+        EventWaitlistEntry.objects.create(event=event, user=users[7])
+        url = f'/api/content/events/{event.pk}/registrations/bulk/'
+
+        response = self.admin.post(url, {'user_ids': ids + [999999, ids[1]]}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result['status'] for result in response.json()['results']],
+            ['already_registered'] + ['registered'] * 4 + ['event_full'] * 3 + ['user_not_found'],
+        )
+        self.assertEqual(response.json()['current_registrations'], 5)
+        self.assertRegisteredCount(event, 5)
+
+        response = self.admin.delete(url, {'user_ids': ids[:3] + [ids[6]]}, format='json')
+        self.assertEqual(
+            [result['status'] for result in response.json()['results']],
+            ['removed'] * 3 + ['not_registered'],
+        )
+        # The waitlisted user is promoted into one of the freed spots
+        self.assertEqual(response.json()['current_registrations'], 3)
+        self.assertTrue(EventRegistration.objects.filter(event=event, user=users[7]).exists())
+        self.assertRegisteredCount(event, 3)
+
+    def test_rejects_bad_input_and_non_staff(self):
+        event = self.create_event()
+        url = f'/api/content/events/{event.pk}/registrations/bulk/'
+        self.assertEqual(self.admin.post(url, {'user_ids': 'all'}, format='json').status_code, 400)
+        member = client_for(self.create_users(1)[0])
+        self.assertEqual(member.post(url, {'user_ids': []}, format='json').status_code, 403)
+
+
+    def test_remove_is_one_delete(self):
+        event = self.create_event(capacity=5)
+        ids = [user.pk for user in self.create_users(4)]
+        Event.objects.register_users(event.pk, ids)
+        with CaptureQueriesContext(connection) as captured:
+            Event.objects.unregister_users(event.pk, ids[:3])
+        table = f'"{EventRegistration._meta.db_table}"'
+        deletes = [query['sql'] for query in captured.captured_queries if query['sql'].startswith(f'DELETE FROM {table}')]
+        self.assertEqual(len(deletes), 1)
+        self.assertRegisteredCount(event, 1)
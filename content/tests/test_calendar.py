@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta
+
+from django.utils import timezone
+
+from .utils import ContentTestCase
+
+
+class EventCalendarTests(ContentTestCase):
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        self.past = self.create_event(title='Past', date=now - timedelta(days=3))
+        self.soon = self.create_event(title='Soon', date=now + timedelta(days=1), category='Sports')
+        self.later = self.create_event(title='Later', date=now + timedelta(days=40))
+
+    def titles(self, **params):
+        response = self.admin.get('/api/content/events/calendar/', params)
+        self.assertEqual(response.status_code, 200)
+        return [event['title'] for event in response.json()]
+
+    def test_upcoming_only_by_default(self):
+        self.assertEqual(self.titles(), ['Soon', 'Later'])
+        self.assertEqual(self.titles(include_past='true'), ['Past', 'Soon', 'Later'])
+
+    def test_date_range_and_category(self):
+        start = (timezone.now() - timedelta(days=5)).date().isoformat()
+        end = (timezone.now() + timedelta(days=2)).date().isoformat()
+        self.assertEqual(self.titles(start=start, end=end), ['Past', 'Soon'])
+        self.assertEqual(self.titles(start=start, category='Sports'), ['Soon'])
+
+    def test_end_date_covers_the_whole_day(self):
+        day = timezone.localtime(self.later.date).date()
+        self.assertEqual(self.titles(start=day.isoformat(), end=day.isoformat()), ['Later'])
+        start = timezone.make_aware(datetime.combine(day, datetime.min.time())).isoformat()
+        self.assertEqual(self.titles(start=start, end=self.later.date.isoformat()), ['Later'])
+
+    def test_invalid_dates(self):
+        response = self.admin.get('/api/content/events/calendar/', {'start': 'tomorrow'})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,35 @@
+from content.counters import news_view_counter
+from content.models import News
+
+from .utils import ContentTestCase
+
+
+class ConditionalGetTests(ContentTestCase):
+    def test_news_detail(self):
+        news = News.objects.create(title='Title', content='c', author=self.staff)
+        url = f'/api/content/news/{news.pk}/'
+        response = self.admin.get(url)
+        etag, last_modified = response['ETag'], response['Last-Modified']
+
+        self.assertEqual(self.admin.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.admin.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+        # Views don't change the validators
+        news_view_counter.flush()
+        self.assertEqual(self.admin.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.admin.put(url, {'title': 'New title'}, format='json')
+        response = self.admin.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'New title')
+
+    def test_event_detail_depends_on_registration(self):
+        event = self.create_event(capacity=3)
+        url = f'/api/content/events/{event.pk}/'
+        etag = self.admin.get(url)['ETag']
+        self.assertEqual(self.admin.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.admin.post(f'/api/content/events/{event.pk}/register/')
+        response = self.admin.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['is_registered'])
+        self.assertIn('Authorization', response['Vary'])
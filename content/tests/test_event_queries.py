@@ -0,0 +1,27 @@
+from content.models import Event
+
+from .utils import ContentTestCase
+
+
+class EventQueryCountTests(ContentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.events = [self.create_event(capacity=3) for _ in range(10)]
+        for event in self.events[::2]:
+            Event.objects.register_users(event.pk, [self.staff.pk])
+
+    def test_list_is_one_query_plus_registrations(self):
+        # The events, then which of them the user is registered for, however many rows
+        with self.settings(CONTENT_LIST_CACHE_TIMEOUT=0), self.assertNumQueries(2):
+            response = self.admin.get('/api/content/events/?fields=all')
+        data = response.json()
+        self.assertEqual(len(data), 10)
+        self.assertEqual([event['is_registered'] for event in data], [True, False] * 5)
+        self.assertEqual([event['current_registrations'] for event in data], [1, 0] * 5)
+        self.assertEqual(data[0]['author_name'], 'staff')
+
+    def test_detail(self):
+        with self.assertNumQueries(2):
+            response = self.admin.get(f'/api/content/events/{self.events[0].pk}/')
+        self.assertTrue(response.json()['is_registered'])
+        self.assertEqual(response.json()['available_spots'], 2)
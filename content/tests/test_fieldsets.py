@@ -0,0 +1,43 @@
+from content.models import News
+from content.serializers import EventSerializer, NewsSerializer
+
+from .utils import ContentTestCase
+
+
+class SparseFieldsetTests(ContentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.news = News.objects.create(title='News', content='Long body', author=self.staff)
+        self.event = self.create_event()
+
+    def fields(self, path):
+        response = self.admin.get(path)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        return list(data[0] if isinstance(data, list) else data)
+
+    def test_lists_default_to_the_compact_shape(self):
+        self.assertEqual(self.fields('/api/content/news/'), NewsSerializer.Meta.list_fields)
+        self.assertEqual(self.fields('/api/content/events/'), EventSerializer.Meta.list_fields)
+        self.assertEqual(self.fields('/api/content/news/?fields=all'), NewsSerializer.Meta.fields)
+        self.assertEqual(self.fields(f'/api/content/news/{self.news.pk}/'), NewsSerializer.Meta.fields)
+
+    def test_fields_and_omit(self):
+        self.assertEqual(self.fields('/api/content/news/?fields=title,views'), ['id', 'title', 'views'])
+        self.assertEqual(self.fields(f'/api/content/events/{self.event.pk}/?fields=title'), ['id', 'title'])
+        fields = self.fields('/api/content/events/?omit=id,is_registered,excerpt')
+        self.assertEqual(fields, [name for name in EventSerializer.Meta.list_fields if name not in ('is_registered', 'excerpt')])
+
+    def test_unknown_fields(self):
+        for path in ('/api/content/news/?fields=title,nope', '/api/content/events/?omit=nope',
+                     f'/api/content/news/{self.news.pk}/?fields=nope'):
+            response = self.admin.get(path)
+            self.assertEqual(response.status_code, 400, path)
+            self.assertIn('nope', response.json()['error'])
+
+    def test_large_columns_are_deferred_when_not_sent(self):
+        self.assertEqual(NewsSerializer.deferred_fields(NewsSerializer.Meta.list_fields), ['content'])
+        self.assertEqual(NewsSerializer.deferred_fields(), [])
+        with self.assertNumQueries(1) as queries:
+            self.admin.get('/api/content/news/')
+        self.assertNotIn('"content_news"."content"', queries.captured_queries[0]['sql'])
@@ -0,0 +1,63 @@
+from django.test import override_settings
+
+from content.models import News, Event
+
+from .utils import ContentTestCase, client_for
+
+
+@override_settings(CONTENT_LIST_CACHE_TIMEOUT=60)
+class ListCacheTests(ContentTestCase):
+    def test_news_list_is_served_from_the_cache_until_a_save(self):
+        news = News.objects.create(title='First', content='c', author=self.staff)
+        self.admin.get('/api/content/news/')
+        with self.assertNumQueries(0):
+            self.assertEqual(len(self.admin.get('/api/content/news/').json()), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            News.objects.create(title='Second', content='c', author=self.staff)
+        self.assertEqual(len(self.admin.get('/api/content/news/').json()), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            news.delete()
+        self.assertEqual([item['title'] for item in self.admin.get('/api/content/news/').json()], ['Second'])
+
+    def test_query_strings_are_cached_separately(self):
+        for index in range(3):
+            News.objects.create(title=f'News {index}', content='c', author=self.staff)
+        self.assertEqual(len(self.admin.get('/api/content/news/?page_size=1').json()), 1)
+        self.assertEqual(len(self.admin.get('/api/content/news/?page_size=2').json()), 2)
+
+    def test_registrations_invalidate_events_and_is_registered_stays_per_user(self):
+        event = self.create_event(capacity=3)
+        member = self.create_users(1)[0]
+        member_client = client_for(member)
+        self.admin.get('/api/content/events/')
+        # Only the per-user registration lookup runs on a cached page
+        with self.assertNumQueries(1):
+            self.admin.get('/api/content/events/')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            member_client.post(f'/api/content/events/{event.pk}/register/')
+        data = member_client.get('/api/content/events/').json()
+        self.assertEqual(data[0]['current_registrations'], 1)
+        self.assertTrue(data[0]['is_registered'])
+        self.assertFalse(self.admin.get('/api/content/events/').json()[0]['is_registered'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            member_client.delete(f'/api/content/events/{event.pk}/unregister/')
+        self.assertEqual(self.admin.get('/api/content/events/').json()[0]['current_registrations'], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Event.objects.register_users(event.pk, [member.pk])
+        self.assertEqual(self.admin.get('/api/content/events/').json()[0]['current_registrations'], 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            member.delete()
+        self.assertEqual(self.admin.get('/api/content/events/').json()[0]['current_registrations'], 0)
+
+
+class ListCacheDisabledTests(ContentTestCase):
+    def test_lists_are_not_cached_without_a_timeout(self):
+        News.objects.create(title='First', content='c', author=self.staff)
+        self.admin.get('/api/content/news/')
+        with self.assertNumQueries(1):
+            self.admin.get('/api/content/news/')
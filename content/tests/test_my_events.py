@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from content.models import Event
+
+from .utils import ContentTestCase
+
+
+class MyEventsTests(ContentTestCase):
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        self.events = {
+            title: self.create_event(title=title, date=now + timedelta(days=days))
+            for title, days in (('Last week', -7), ('Yesterday', -1), ('Tomorrow', 1), ('Next week', 7))
+        }
+        for event in self.events.values():
+            Event.objects.register_users(event.pk, [self.staff.pk])
+        self.create_event(title='Not registered')
+
+    def titles(self, when=None):
+        # The registered events joined to their authors, in one query
+        with self.assertNumQueries(1):
+            response = self.admin.get('/api/content/events/mine/', {'when': when} if when else {})
+        self.assertEqual(response.status_code, 200)
+        return [event['title'] for event in response.json()]
+
+    def test_upcoming_past_and_all(self):
+        self.assertEqual(self.titles(), ['Tomorrow', 'Next week'])
+        self.assertEqual(self.titles('past'), ['Yesterday', 'Last week'])
+        self.assertEqual(self.titles('all'), ['Last week', 'Yesterday', 'Tomorrow', 'Next week'])
+
+    def test_rows_carry_the_registration(self):
+        event = self.admin.get('/api/content/events/mine/').json()[0]
+        self.assertTrue(event['is_registered'])
+        self.assertIn('registered_at', event)
+        self.assertNotIn('description', event)
+
+    def test_invalid_when(self):
+        self.assertEqual(self.admin.get('/api/content/events/mine/?when=soon').status_code, 400)
@@ -0,0 +1,55 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from content.models import News, Event
+
+from .utils import ContentTestCase
+
+
+class KeysetPaginationTests(ContentTestCase):
+    def collect_pages(self, url):
+        ids, pages = [], 0
+        while url:
+            response = self.admin.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids += [item['id'] for item in response.json()]
+            pages += 1
+            link = response.get('Link')
+            url = link[1:link.index('>')] if link else None
+            if url:
+                self.assertIn('cursor=', url)
+                self.assertTrue(response['X-Next-Cursor'])
+        return ids, pages
+
+    def test_pages_cover_every_row_once(self):
+        created_at = timezone.now()
+        for index in range(25):
+            News.objects.create(title=f'News {index}', content='c', author=self.staff)
+        # Identical sort keys are ordered by id, so ties don't repeat or skip rows
+        News.objects.update(created_at=created_at)
+        for index in range(25):
+            self.create_event(date=created_at + timedelta(days=index % 4))
+
+        for url, model in (('/api/content/news/?page_size=10', News), ('/api/content/events/?page_size=10', Event)):
+            ids, pages = self.collect_pages(url)
+            self.assertEqual(pages, 3)
+            self.assertEqual(sorted(ids), sorted(model.objects.values_list('pk', flat=True)))
+
+    def test_events_are_ordered_by_date(self):
+        now = timezone.now()
+        for days in (3, 1, 2):
+            self.create_event(date=now + timedelta(days=days))
+        ids, _ = self.collect_pages('/api/content/events/?page_size=1')
+        self.assertEqual(ids, list(Event.objects.order_by('date', 'id').values_list('pk', flat=True)))
+
+    def test_page_size_is_capped(self):
+        for index in range(5):
+            News.objects.create(title=f'News {index}', content='c', author=self.staff)
+        with self.settings(CONTENT_MAX_PAGE_SIZE=3):
+            self.assertEqual(len(self.admin.get('/api/content/news/?page_size=50').json()), 3)
+
+    def test_invalid_cursor(self):
+        for cursor in ('garbage', 'WyJub3QgYSBkYXRlIiwgMV0', 'WyIyMDI0LTAxLTAxVDAwOjAwOjAwWiIsICJ4Il0'):
+            self.assertEqual(self.admin.get(f'/api/content/news/?cursor={cursor}').status_code, 400)
+            self.assertEqual(self.admin.get(f'/api/content/events/?cursor={cursor}').status_code, 400)
@@ -0,0 +1,59 @@
+from content.models import Event, EventRegistration
+
+from .utils import ContentTestCase, client_for
+
+
+class EventRegistrationTests(ContentTestCase):
+    def test_capacity_guard(self):
+        event = self.create_event(capacity=2)
+        statuses = [
+            client_for(user).post(f'/api/content/events/{event.pk}/register/').status_code
+            for user in self.create_users(3)
+        ]
+        self.assertEqual(statuses, [201, 201, 400])
+        self.assertRegisteredCount(event, 2)
+
+    def test_duplicate_registration_rolls_back_the_spot(self):
+        event = self.create_event(capacity=5)
+        client = client_for(self.create_users(1)[0])
+        self.assertEqual(client.post(f'/api/content/events/{event.pk}/register/').status_code, 201)
+
+        response = client.post(f'/api/content/events/{event.pk}/register/')
+        self.assertEqual(response.status_code, 400)
+        self.assertRegisteredCount(event, 1)
+
+    def test_unregister_and_removal_release_spots(self):
+        event = self.create_event(capacity=3)
+        users = self.create_users(2)
+        for user in users:
+            client_for(user).post(f'/api/content/events/{event.pk}/register/')
+
+        client = client_for(users[0])
+        response = client.delete(f'/api/content/events/{event.pk}/unregister/')
+        self.assertEqual(response.json()['current_registrations'], 1)
+        self.assertEqual(client.delete(f'/api/content/events/{event.pk}/unregister/').status_code, 400)
+
+        url = f'/api/content/events/{event.pk}/registrations/{users[1].pk}/'
+        self.assertEqual(self.admin.delete(url).json()['current_registrations'], 0)
+        self.assertEqual(self.admin.delete(url).status_code, 404)
+        self.assertRegisteredCount(event, 0)
+
+    def test_deleting_a_user_releases_their_spots_in_one_update(self):
+        events = [self.create_event(capacity=3) for _ in range(3)]
+        leaving, staying = self.create_users(2)
+        for event in events:
+            Event.objects.register_users(event.pk, [leaving.pk, staying.pk])
+
+        leaving.delete()
+        for event in events:
+            self.assertRegisteredCount(event, 1)
+
+    def test_deleting_an_event_deletes_registrations_in_bulk(self):
+        event = self.create_event(capacity=50)
+        users = self.create_users(30)
+        Event.objects.register_users(event.pk, [user.pk for user in users])
+
+        # Without per-row receivers the cascade is one DELETE, however many rows
+        with self.assertNumQueries(3):
+            event.delete()
+        self.assertFalse(EventRegistration.objects.exists())
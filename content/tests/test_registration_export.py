@@ -0,0 +1,55 @@
+import csv
+import io
+import json
+
+from django.contrib.auth.models import User
+
+from authentication.models import UserProfile
+from content.models import Event
+from content.views import REGISTRATION_EXPORT_COLUMNS
+
+from .utils import ContentTestCase, client_for, streamed_body
+
+
+class RegistrationExportTests(ContentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.event = self.create_event(capacity=10)
+        users = self.create_users(3)
+        User.objects.filter(pk=users[0].pk).update(first_name='Ada', last_name='L', email='ada@example.com')
+        UserProfile.objects.filter(user=users[0]).update(phone_number='5551234')
+        Event.objects.register_users(self.event.pk, [user.pk for user in users])
+        self.url = f'/api/content/events/{self.event.pk}/registrations/export/'
+
+    def export(self, query=''):
+        # The event, then the registrations joined to their users and profiles
+        with self.assertNumQueries(2):
+            response = self.admin.get(self.url + query)
+            body = streamed_body(response)
+        return response, body
+
+    def test_csv(self):
+        response, body = self.export()
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn(f'event-{self.event.pk}-registrations.csv', response['Content-Disposition'])
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(list(rows[0]), REGISTRATION_EXPORT_COLUMNS)
+        rows = {row['username']: row for row in rows}
+        self.assertEqual(sorted(rows), ['member0', 'member1', 'member2'])
+        self.assertEqual(rows['member0']['user_name'], 'Ada L')
+        self.assertEqual(rows['member0']['user_phone'], '5551234')
+        self.assertEqual(rows['member1']['user_phone'], '')
+
+    def test_ndjson(self):
+        response, body = self.export('?stream=ndjson')
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = {row['username']: row for row in map(json.loads, body.splitlines())}
+        self.assertEqual(sorted(rows), ['member0', 'member1', 'member2'])
+        self.assertEqual(rows['member0']['user_email'], 'ada@example.com')
+        self.assertIsNone(rows['member1']['user_phone'])
+
+    def test_errors(self):
+        self.assertEqual(self.admin.get(self.url + '?stream=xml').status_code, 400)
+        self.assertEqual(self.admin.get('/api/content/events/999999/registrations/export/').status_code, 404)
+        member = client_for(User.objects.get(username='member0'))
+        self.assertEqual(member.get(self.url).status_code, 403)
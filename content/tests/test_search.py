@@ -0,0 +1,71 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.sql import emit_post_migrate_signal
+from django.db import connection
+
+from content.models import News
+from content.search import SQLITE_FTS_TABLES
+from content.serializers import EventSerializer, NewsSerializer
+
+from .utils import ContentTestCase
+
+
+class SearchTests(ContentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.title_hit = News.objects.create(title='Gardening club', content='Weekly meeting', author=self.staff)
+        self.body_hit = News.objects.create(title='Notice', content='The gardening shed is closed', author=self.staff)
+        News.objects.create(title='Other', content='Nothing relevant', author=self.staff)
+        self.event = self.create_event(title='Garden party', location='Gardens')
+
+    def test_results_are_ranked_and_compact(self):
+        response = self.admin.get('/api/content/search/', {'q': 'garden'})
+        self.assertEqual(response.status_code, 200)
+        results = response.json()
+        self.assertEqual({(hit['type'], hit['item']['id']) for hit in results}, {
+            ('news', self.title_hit.pk), ('news', self.body_hit.pk), ('events', self.event.pk),
+        })
+        news = [hit['item']['id'] for hit in results if hit['type'] == 'news']
+        self.assertEqual(news, [self.title_hit.pk, self.body_hit.pk])
+        for hit in results:
+            serializer = NewsSerializer if hit['type'] == 'news' else EventSerializer
+            self.assertEqual(list(hit['item']), serializer.Meta.list_fields)
+
+    def test_type_filter_and_validation(self):
+        response = self.admin.get('/api/content/search/', {'q': 'garden', 'type': 'events'})
+        self.assertEqual([hit['type'] for hit in response.json()], ['events'])
+        self.assertEqual(self.admin.get('/api/content/search/', {'q': ' '}).status_code, 400)
+        self.assertEqual(self.admin.get('/api/content/search/', {'q': 'garden', 'type': 'x'}).status_code, 400)
+
+    def test_index_follows_updates_and_deletes(self):
+        self.title_hit.title = 'Chess club'
+        self.title_hit.save()
+        self.body_hit.delete()
+        hits = self.admin.get('/api/content/search/', {'q': 'garden', 'type': 'news'}).json()
+        self.assertEqual(hits, [])
+        hits = self.admin.get('/api/content/search/', {'q': 'chess'}).json()
+        self.assertEqual([hit['item']['id'] for hit in hits], [self.title_hit.pk])
+
+    def test_rebuild_search_index(self):
+        stdout = StringIO()
+        call_command('rebuild_search_index', stdout=stdout)
+        self.assertIn('Search index rebuilt', stdout.getvalue())
+        self.assertEqual(len(self.admin.get('/api/content/search/', {'q': 'garden'}).json()), 3)
+
+    def test_post_migrate_restores_dropped_sqlite_triggers(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('FTS5 triggers are SQLite only')
+        # What SQLite does when a migration rebuilds content_news
+        with connection.cursor() as cursor:
+            for table, fts, columns in SQLITE_FTS_TABLES:
+                for suffix in ('ai', 'ad', 'au'):
+                    cursor.execute(f'DROP TRIGGER {fts}_{suffix}')
+        News.objects.create(title='Gardening tips', content='Added without triggers', author=self.staff)
+
+        emit_post_migrate_signal(0, False, connection.alias)
+
+        hits = self.admin.get('/api/content/search/', {'q': 'tips'}).json()
+        self.assertEqual(len(hits), 1)
+        News.objects.create(title='Composting', content='c', author=self.staff)
+        self.assertEqual(len(self.admin.get('/api/content/search/', {'q': 'composting'}).json()), 1)
@@ -0,0 +1,44 @@
+import json
+
+from content.streaming import iter_json
+
+from .utils import ContentTestCase, client_for, streamed_body
+
+
+class UsersStreamTests(ContentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_users(5)
+
+    def test_streams_match_the_plain_list(self):
+        plain = self.admin.get('/api/content/admin/users/').json()
+        self.assertEqual(len(plain), 6)
+
+        response = self.admin.get('/api/content/admin/users/?stream=json')
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(streamed_body(response)), plain)
+
+        response = self.admin.get('/api/content/admin/users/?stream=ndjson')
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertEqual([json.loads(line) for line in streamed_body(response).splitlines()], plain)
+
+    def test_rejects_unknown_formats_and_non_staff(self):
+        self.assertEqual(self.admin.get('/api/content/admin/users/?stream=xml').status_code, 400)
+        member = client_for(self.create_users(1, prefix='other')[0])
+        self.assertEqual(member.get('/api/content/admin/users/?stream=json').status_code, 403)
+
+
+class IterJSONTests(ContentTestCase):
+    def test_chunks(self):
+        rows = [{'n': index} for index in range(7)]
+        chunks = list(iter_json(iter(rows), chunk_size=3))
+        # The opening bracket, three chunks of rows and the closing bracket
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual(json.loads(''.join(chunks)), rows)
+        ndjson = ''.join(iter_json(iter(rows), ndjson=True, chunk_size=3))
+        self.assertEqual([json.loads(line) for line in ndjson.splitlines()], rows)
+
+    def test_empty(self):
+        self.assertEqual(''.join(iter_json(iter([]))), '[]')
+        self.assertEqual(''.join(iter_json(iter([]), ndjson=True)), '')
@@ -0,0 +1,43 @@
+from content.counters import news_view_counter
+from content.models import News
+
+from .utils import ContentTestCase
+
+
+class ViewCounterTests(ContentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.news = News.objects.create(title='Title', content='c', author=self.staff)
+
+    def test_views_are_buffered_and_shown(self):
+        url = f'/api/content/news/{self.news.pk}/'
+        self.admin.get(url)
+        # Recording a view writes nothing; the response still counts it
+        with self.assertNumQueries(1):
+            response = self.admin.get(url)
+        self.assertEqual(response.json()['views'], 2)
+        self.assertEqual(News.objects.get(pk=self.news.pk).views, 0)
+        self.assertEqual(news_view_counter.pending(self.news.pk), 2)
+
+    def test_flush_writes_one_update_per_delta(self):
+        other = News.objects.create(title='Other', content='c', author=self.staff)
+        third = News.objects.create(title='Third', content='c', author=self.staff)
+        updated_at = News.objects.get(pk=self.news.pk).updated_at
+        news_view_counter.record(self.news.pk, 2)
+        news_view_counter.record(other.pk, 2)
+        news_view_counter.record(third.pk)
+
+        with self.assertNumQueries(2):
+            news_view_counter.flush()
+        self.assertEqual(
+            dict(News.objects.values_list('pk', 'views')), {self.news.pk: 2, other.pk: 2, third.pk: 1}
+        )
+        self.assertEqual(News.objects.get(pk=self.news.pk).updated_at, updated_at)
+        self.assertEqual(news_view_counter.pending(self.news.pk), 0)
+
+    def test_reset_drops_pending_views(self):
+        news_view_counter.record(self.news.pk)
+        news_view_counter.reset()
+        with self.assertNumQueries(0):
+            news_view_counter.flush()
+        self.assertEqual(News.objects.get(pk=self.news.pk).views, 0)
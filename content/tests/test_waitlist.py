@@ -0,0 +1,62 @@
+from content.models import Event, EventWaitlistEntry
+
+from .utils import ContentTestCase, client_for
+
+
+class WaitlistTests(ContentTestCase):
+    def test_joins_waitlist_when_full_and_is_promoted_in_order(self):
+        event = self.create_event(capacity=1)
+        users = self.create_users(3)
+        clients = [client_for(user) for user in users]
+
+        self.assertEqual(clients[0].post(f'/api/content/events/{event.pk}/waitlist/').status_code, 201)
+        response = clients[1].post(f'/api/content/events/{event.pk}/waitlist/')
+        self.assertEqual((response.status_code, response.json()['position']), (202, 1))
+        response = clients[2].post(f'/api/content/events/{event.pk}/waitlist/')
+        self.assertEqual((response.status_code, response.json()['position']), (202, 2))
+
+        clients[0].delete(f'/api/content/events/{event.pk}/unregister/')
+        status = clients[1].get(f'/api/content/events/{event.pk}/waitlist/').json()
+        self.assertTrue(status['registered'])
+        self.assertFalse(status['waitlisted'])
+        self.assertEqual(clients[2].get(f'/api/content/events/{event.pk}/waitlist/').json()['position'], 1)
+        self.assertRegisteredCount(event, 1)
+
+    def test_raising_capacity_promotes(self):
+        event = self.create_event(capacity=1)
+        for user in self.create_users(3):
+            client_for(user).post(f'/api/content/events/{event.pk}/waitlist/')
+
+        response = self.admin.put(f'/api/content/events/{event.pk}/', {'capacity': 5}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertRegisteredCount(event, 3)
+        self.assertFalse(EventWaitlistEntry.objects.filter(event=event).exists())
+
+    def test_registering_from_the_waitlist_clears_the_entry(self):
+        event = self.create_event(capacity=1)
+        waiting, holder, other = self.create_users(3)
+        client_for(holder).post(f'/api/content/events/{event.pk}/register/')
+        client_for(waiting).post(f'/api/content/events/{event.pk}/waitlist/')
+
+        # Deleting the holder frees the spot without promoting anyone
+        holder.delete()
+        response = client_for(waiting).post(f'/api/content/events/{event.pk}/waitlist/')
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(EventWaitlistEntry.objects.filter(event=event, user=waiting).exists())
+
+        # A later promotion must not trip over the registered user
+        client_for(other).post(f'/api/content/events/{event.pk}/waitlist/')
+        response = self.admin.put(f'/api/content/events/{event.pk}/', {'capacity': 3}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertRegisteredCount(event, 2)
+
+    def test_promotion_skips_stale_entries(self):
+        event = self.create_event(capacity=2)
+        registered, waiting = self.create_users(2)
+        Event.objects.register_users(event.pk, [registered.pk])
+        EventWaitlistEntry.objects.create(event=event, user=registered)
+        EventWaitlistEntry.objects.create(event=event, user=waiting)
+
+        self.assertEqual(Event.objects.promote_waitlist(event.pk), [waiting.pk])
+        self.assertRegisteredCount(event, 2)
+        self.assertFalse(EventWaitlistEntry.objects.filter(event=event).exists())
@@ -0,0 +1,53 @@
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from content.counters import news_view_counter
+from content.models import Event, EventRegistration
+
+
+def client_for(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+def streamed_body(response):
+    """The full body of a streaming response, sync or async (under ASGI)"""
+    if response.is_async:
+        async def read():
+            return [chunk async for chunk in response.streaming_content]
+        chunks = async_to_sync(read)()
+    else:
+        chunks = response.streaming_content
+    return b''.join(chunks).decode()
+
+
+class ContentTestCase(TestCase):
+    def setUp(self):
+        # Cached list pages and buffered view counts live outside the test transaction
+        cache.clear()
+        news_view_counter.reset()
+        self.staff = User.objects.create_user('staff', password='x', is_staff=True)
+        self.admin = client_for(self.staff)
+
+    def tearDown(self):
+        news_view_counter.reset()
+
+    def create_event(self, **kwargs):
+        kwargs = {'title': 'Event', 'description': 'd', 'location': 'Hall', 'author': self.staff,
+                  'date': timezone.now() + timedelta(days=1), **kwargs}
+        return Event.objects.create(**kwargs)
+
+    def create_users(self, count, prefix='member'):
+        return [User.objects.create_user(f'{prefix}{index}', password='x') for index in range(count)]
+
+    def assertRegisteredCount(self, event, expected):
+        event.refresh_from_db(fields=['registered'])
+        self.assertEqual(event.registered, expected)
+        self.assertEqual(EventRegistration.objects.filter(event=event).count(), expected)
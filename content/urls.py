@@ -1,23 +1,35 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+# Under ASGI the read-heavy and streaming endpoints are served by coroutines
+read_views = async_views if settings.CONTENT_ASYNC_VIEWS else views
 
 urlpatterns = [
     # News URLs
-    path('news/', views.news_list, name='news-list'),
-    path('news/<int:pk>/', views.news_detail, name='news-detail'),
+    path('news/', read_views.news_list, name='news-list'),
+    path('news/<int:pk>/', read_views.news_detail, name='news-detail'),
     
     # Events URLs
-    path('events/', views.events_list, name='events-list'),
-    path('events/<int:pk>/', views.event_detail, name='event-detail'),
+    path('events/', read_views.events_list, name='events-list'),
+    path('events/calendar/', views.events_calendar, name='events-calendar'),
+    path('events/mine/', views.my_events, name='my-events'),
+    path('events/<int:pk>/', read_views.event_detail, name='event-detail'),
+    
+    # Search
+    path('search/', views.search, name='content-search'),
     
     # Event Registration URLs
     path('events/<int:pk>/register/', views.register_for_event, name='event-register'),
     path('events/<int:pk>/unregister/', views.unregister_from_event, name='event-unregister'),
+    path('events/<int:pk>/waitlist/', views.event_waitlist, name='event-waitlist'),
     path('events/<int:pk>/registrations/', views.event_registrations, name='event-registrations'),
+    path('events/<int:pk>/registrations/export/', read_views.export_event_registrations, name='export-event-registrations'),
+    path('events/<int:pk>/registrations/bulk/', views.bulk_event_registrations, name='bulk-event-registrations'),
     path('events/<int:pk>/registrations/<int:user_id>/', views.remove_event_registration, name='remove-event-registration'),
     
     # Admin URLs
-    path('admin/users/', views.users_list, name='admin-users-list'),
+    path('admin/users/', read_views.users_list, name='admin-users-list'),
     path('admin/users/<int:user_id>/', views.update_user_permissions, name='admin-update-permissions'),
     path('admin/events/', views.admin_events_overview, name='admin-events-overview'),
     
@@ -3,12 +3,26 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.db.models import F
 from django.shortcuts import get_object_or_404
+from django.conf import settings
+from django.utils import timezone
 from authentication.models import UserProfile
-from .models import News, Event, EventRegistration
-from .serializers import NewsSerializer, EventSerializer, EventRegistrationSerializer
+from .models import News, Event, EventRegistration, EventWaitlistEntry
+from .serializers import InvalidFieldset, NewsSerializer, EventSerializer, EventRegistrationSerializer
+from .cache import get_cached_list, set_cached_list
+from .conditional import make_etag, not_modified, set_validators
+from .counters import news_view_counter
+from .filters import filter_events
+from .pagination import InvalidCursor, get_page_size, paginate_keyset, paginated_response
+from .search import SEARCH_TYPES, search_content
+from .streaming import STREAM_CHUNK_SIZE, STREAM_FORMATS, streaming_csv_response, streaming_json_response
 from urllib.parse import urlparse
 
+# Most users one bulk registration request may add or remove
+BULK_REGISTRATION_LIMIT = 1000
+
 def can_create_content(user):
     """Check if user can create content"""
     if user.is_staff or user.is_superuser:
@@ -17,6 +31,22 @@ def can_create_content(user):
         return user.profile.can_create_content
     return False
 
+def event_serializer_context(request, events):
+    """Serializer context with the user's registrations for ``events`` resolved in one query"""
+    registered_event_ids = set(
+        EventRegistration.objects.filter(user=request.user, event__in=events)
+        .order_by().values_list('event_id', flat=True)
+    )
+    return {'request': request, 'registered_event_ids': registered_event_ids}
+
+def overlay_is_registered(request, events_data):
+    """Set the user's is_registered flags on serialized events with one query"""
+    registered_event_ids = set(
+        EventRegistration.objects.filter(user=request.user, event_id__in=[event['id'] for event in events_data])
+        .order_by().values_list('event_id', flat=True)
+    )
+    return [{**event, 'is_registered': event['id'] in registered_event_ids} for event in events_data]
+
 def is_valid_image_url(url):
     """Validate if URL is a valid image URL"""
     try:
@@ -55,9 +85,23 @@ def is_valid_image_url(url):
 @permission_classes([IsAuthenticated])
 def news_list(request):
     if request.method == 'GET':
-        news = News.objects.all()[:10]  # Limit to 10 items
-        serializer = NewsSerializer(news, many=True)
-        return Response(serializer.data)
+        try:
+            # Lists send the compact shape unless ?fields= asks for more
+            fieldset = NewsSerializer.fieldset(request, NewsSerializer.Meta.list_fields)
+        except InvalidFieldset as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        cached = get_cached_list('news', request)
+        if cached is None:
+            news = News.objects.select_related('author__profile').defer(*NewsSerializer.deferred_fields(**fieldset))
+            try:
+                news, next_cursor = paginate_keyset(request, news, 'created_at', descending=True)
+            except InvalidCursor:
+                return Response({'error': 'Invalid cursor'}, status=status.HTTP_400_BAD_REQUEST)
+            serializer = NewsSerializer(news, many=True, **fieldset)
+            cached = {'data': serializer.data, 'next_cursor': next_cursor}
+            set_cached_list('news', request, cached)
+        return paginated_response(request, cached['data'], cached['next_cursor'])
     
     elif request.method == 'POST':
         if not can_create_content(request.user):
@@ -75,14 +119,24 @@ def news_list(request):
 @api_view(['GET', 'PUT', 'DELETE'])
 @permission_classes([IsAuthenticated])
 def news_detail(request, pk):
-    news = get_object_or_404(News, pk=pk)
+    news = get_object_or_404(News.objects.select_related('author__profile'), pk=pk)
     
     if request.method == 'GET':
-        # Increment view count
-        news.views += 1
-        news.save()
-        serializer = NewsSerializer(news)
-        return Response(serializer.data)
+        try:
+            fieldset = NewsSerializer.fieldset(request)
+        except InvalidFieldset as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Buffer the view; it is written back in batches by news_view_counter
+        news_view_counter.record(news.pk)
+        
+        # View flushes don't touch updated_at, so a counted view can still be a 304
+        etag = make_etag('news', news.pk, news.updated_at.isoformat())
+        response = not_modified(request, etag, news.updated_at)
+        if response is None:
+            serializer = NewsSerializer(news, **fieldset)
+            response = Response(serializer.data)
+        return set_validators(response, etag, news.updated_at)
     
     elif request.method == 'PUT':
         # Check if user can edit (author or staff)
@@ -113,9 +167,29 @@ def news_detail(request, pk):
 @permission_classes([IsAuthenticated])
 def events_list(request):
     if request.method == 'GET':
-        events = Event.objects.all()[:10]  # Limit to 10 items
-        serializer = EventSerializer(events, many=True, context={'request': request})
-        return Response(serializer.data)
+        try:
+            # Lists send the compact shape unless ?fields= asks for more
+            fieldset = EventSerializer.fieldset(request, EventSerializer.Meta.list_fields)
+        except InvalidFieldset as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        cached = get_cached_list('events', request)
+        if cached is None:
+            events = Event.objects.select_related('author__profile').defer(*EventSerializer.deferred_fields(**fieldset))
+            try:
+                events, next_cursor = paginate_keyset(request, events, 'date')
+            except InvalidCursor:
+                return Response({'error': 'Invalid cursor'}, status=status.HTTP_400_BAD_REQUEST)
+            # The cached body is shared by all users; is_registered is overlaid per request below
+            serializer = EventSerializer(
+                events, many=True, context={'request': request, 'registered_event_ids': set()}, **fieldset
+            )
+            cached = {'data': serializer.data, 'next_cursor': next_cursor}
+            set_cached_list('events', request, cached)
+        events_data = cached['data']
+        if 'is_registered' in EventSerializer.field_names(**fieldset):
+            events_data = overlay_is_registered(request, events_data)
+        return paginated_response(request, events_data, cached['next_cursor'])
     
     elif request.method == 'POST':
         if not can_create_content(request.user):
@@ -130,14 +204,118 @@ def events_list(request):
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def events_calendar(request):
+    """Events in a date range, upcoming only unless ?start= or ?include_past=true is given"""
+    try:
+        events = filter_events(Event.objects.all(), request.query_params)
+    except ValueError:
+        return Response(
+            {'error': 'start and end must be ISO dates or datetimes'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    include_past = request.query_params.get('include_past', '').lower() in ('1', 'true', 'yes')
+    if not request.query_params.get('start') and not include_past:
+        events = events.filter(date__gte=timezone.now())
+    
+    # A lean column list keeps a month view to one range scan on the date indexes
+    events = events.values('id', 'title', 'category', 'image', 'date', 'location', 'capacity', 'registered')
+    try:
+        events, next_cursor = paginate_keyset(
+            request, events, 'date', default_page_size=getattr(settings, 'CONTENT_MAX_PAGE_SIZE', 100)
+        )
+    except InvalidCursor:
+        return Response({'error': 'Invalid cursor'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    events_data = [{
+        'id': event['id'],
+        'title': event['title'],
+        'category': event['category'],
+        'image': event['image'],
+        'date': event['date'],
+        'location': event['location'],
+        'capacity': event['capacity'],
+        'current_registrations': event['registered'],
+        'is_full': event['registered'] >= event['capacity'],
+        'available_spots': max(0, event['capacity'] - event['registered'])
+    } for event in events]
+    
+    return paginated_response(request, events_data, next_cursor)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def my_events(request):
+    """Events the current user is registered for: upcoming (default), past or all"""
+    when = request.query_params.get('when', 'upcoming')
+    if when not in ('upcoming', 'past', 'all'):
+        return Response(
+            {'error': 'when must be one of: upcoming, past, all'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    try:
+        fieldset = EventSerializer.fieldset(request, EventSerializer.Meta.list_fields)
+    except InvalidFieldset as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    # One join from the user's registrations to their events; the filter and
+    # the registered_at annotation share the same join
+    events = (
+        Event.objects.filter(registrations__user=request.user)
+        .annotate(registered_at=F('registrations__registered_at'))
+        .select_related('author__profile')
+        .defer(*EventSerializer.deferred_fields(**fieldset))
+    )
+    now = timezone.now()
+    if when == 'upcoming':
+        events = events.filter(date__gte=now)
+    elif when == 'past':
+        events = events.filter(date__lt=now)
+    
+    try:
+        # Past events read most recent first
+        events, next_cursor = paginate_keyset(request, events, 'date', descending=when == 'past')
+    except InvalidCursor:
+        return Response({'error': 'Invalid cursor'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    serializer = EventSerializer(
+        events, many=True, context={'request': request, 'registered_event_ids': {event.pk for event in events}},
+        **fieldset
+    )
+    events_data = [
+        {**data, 'registered_at': event.registered_at}
+        for data, event in zip(serializer.data, events)
+    ]
+    return paginated_response(request, events_data, next_cursor)
+
 @api_view(['GET', 'PUT', 'DELETE'])
 @permission_classes([IsAuthenticated])
 def event_detail(request, pk):
-    event = get_object_or_404(Event, pk=pk)
+    event = get_object_or_404(
+        Event.objects.select_related('author__profile'), pk=pk
+    )
     
     if request.method == 'GET':
-        serializer = EventSerializer(event, context={'request': request})
-        return Response(serializer.data)
+        try:
+            fieldset = EventSerializer.fieldset(request)
+        except InvalidFieldset as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Only look up the user's registration when is_registered is sent
+        context = {'request': request, 'registered_event_ids': set()}
+        if 'is_registered' in EventSerializer.field_names(**fieldset):
+            context = event_serializer_context(request, [event])
+        # Registration changes don't bump updated_at, so events are validated by ETag only
+        etag = make_etag(
+            'event', event.pk, event.updated_at.isoformat(), event.registered,
+            event.pk in context['registered_event_ids']
+        )
+        response = not_modified(request, etag)
+        if response is None:
+            serializer = EventSerializer(event, context=context, **fieldset)
+            response = Response(serializer.data)
+        return set_validators(response, etag, vary=['Authorization'])
     
     elif request.method == 'PUT':
         # Check if user can edit (author or staff)
@@ -150,6 +328,10 @@ def event_detail(request, pk):
         serializer = EventSerializer(event, data=request.data, partial=True, context={'request': request})
         if serializer.is_valid():
             serializer.save()
+            if 'capacity' in serializer.validated_data:
+                # A raised capacity opens spots that waiting users are first in line for
+                Event.objects.promote_waitlist(event.pk)
+                event.refresh_from_db(fields=['registered'])
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
@@ -164,6 +346,59 @@ def event_detail(request, pk):
         event.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def search(request):
+    """Full-text search over news and events, best match first"""
+    query = request.query_params.get('q', '').strip()
+    if not query:
+        return Response({'error': 'Search query is required'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    search_type = request.query_params.get('type')
+    if search_type and search_type not in SEARCH_TYPES:
+        return Response(
+            {'error': f'type must be one of: {", ".join(SEARCH_TYPES)}'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    types = (search_type,) if search_type else SEARCH_TYPES
+    
+    try:
+        page = max(1, int(request.query_params.get('page', 1)))
+    except ValueError:
+        return Response({'error': 'Invalid page'}, status=status.HTTP_400_BAD_REQUEST)
+    page_size = get_page_size(request)
+    
+    # Fetch one extra hit to find out whether there is a next page
+    hits = search_content(query, types, limit=page_size + 1, offset=(page - 1) * page_size)
+    next_page = page + 1 if len(hits) > page_size else None
+    hits = hits[:page_size]
+    
+    # Hits use the same compact shape as the news and events lists
+    news_fields = NewsSerializer.Meta.list_fields
+    event_fields = EventSerializer.Meta.list_fields
+    news = list(
+        News.objects.select_related('author__profile')
+        .defer(*NewsSerializer.deferred_fields(news_fields))
+        .filter(pk__in=[pk for kind, pk, rank in hits if kind == 'news'])
+    )
+    events = list(
+        Event.objects.select_related('author__profile')
+        .defer(*EventSerializer.deferred_fields(event_fields))
+        .filter(pk__in=[pk for kind, pk, rank in hits if kind == 'events'])
+    )
+    items = {
+        'news': {item['id']: item for item in NewsSerializer(news, many=True, fields=news_fields).data},
+        'events': {item['id']: item for item in EventSerializer(
+            events, many=True, context=event_serializer_context(request, events), fields=event_fields
+        ).data},
+    }
+    
+    results = [
+        {'type': kind, 'rank': rank, 'item': items[kind][pk]}
+        for kind, pk, rank in hits if pk in items[kind]
+    ]
+    return paginated_response(request, results, next_page, param='page')
+
 # NEW REGISTRATION ENDPOINTS
 
 @api_view(['POST'])
@@ -172,23 +407,25 @@ def register_for_event(request, pk):
     """Register current user for an event"""
     event = get_object_or_404(Event, pk=pk)
     
-    # Check if event is full
-    if event.is_full:
-        return Response(
-            {'error': 'Event is full'}, 
-            status=status.HTTP_400_BAD_REQUEST
-        )
-    
-    # Check if user is already registered
-    if EventRegistration.objects.filter(event=event, user=request.user).exists():
+    try:
+        with transaction.atomic():
+            # Take a spot with a single capacity-guarded UPDATE
+            if not Event.objects.claim_spots(event.pk):
+                return Response(
+                    {'error': 'Event is full'}, 
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            
+            # The (event, user) unique constraint rejects duplicates and rolls the spot back
+            EventRegistration.objects.create(event=event, user=request.user)
+            EventWaitlistEntry.objects.filter(event=event, user=request.user).delete()
+    except IntegrityError:
         return Response(
             {'error': 'You are already registered for this event'}, 
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    # Create registration
-    registration = EventRegistration.objects.create(event=event, user=request.user)
-    
+    event.refresh_from_db(fields=['registered'])
     return Response({
         'message': 'Successfully registered for event',
         'registered': True,
@@ -202,22 +439,95 @@ def unregister_from_event(request, pk):
     """Unregister current user from an event"""
     event = get_object_or_404(Event, pk=pk)
     
-    try:
-        registration = EventRegistration.objects.get(event=event, user=request.user)
-        registration.delete()
-        
-        return Response({
-            'message': 'Successfully unregistered from event',
-            'registered': False,
-            'current_registrations': event.current_registrations,
-            'available_spots': event.available_spots
-        }, status=status.HTTP_200_OK)
+    with transaction.atomic():
+        # The delete count, not an earlier lookup, decides whether a spot comes back,
+        # so two concurrent requests can't both release it
+        deleted, _ = EventRegistration.objects.filter(event=event, user=request.user).delete()
+        if deleted:
+            Event.objects.release_spots(event.pk)
+            # Hand the freed spot to the head of the waitlist
+            Event.objects.promote_waitlist(event.pk)
     
-    except EventRegistration.DoesNotExist:
+    if not deleted:
         return Response(
             {'error': 'You are not registered for this event'}, 
             status=status.HTTP_400_BAD_REQUEST
         )
+    
+    event.refresh_from_db(fields=['registered'])
+    return Response({
+        'message': 'Successfully unregistered from event',
+        'registered': False,
+        'current_registrations': event.current_registrations,
+        'available_spots': event.available_spots
+    }, status=status.HTTP_200_OK)
+
+@api_view(['GET', 'POST', 'DELETE'])
+@permission_classes([IsAuthenticated])
+def event_waitlist(request, pk):
+    """Check, join or leave the waitlist of a full event"""
+    event = get_object_or_404(Event, pk=pk)
+    
+    if request.method == 'GET':
+        entry = EventWaitlistEntry.objects.filter(event=event, user=request.user).first()
+        return Response({
+            'registered': EventRegistration.objects.filter(event=event, user=request.user).exists(),
+            'waitlisted': entry is not None,
+            'position': entry.position if entry else None,
+            'waitlist_length': event.waitlist_entries.count()
+        })
+    
+    elif request.method == 'POST':
+        try:
+            with transaction.atomic():
+                # Register straight away if a spot is open, otherwise queue up
+                if Event.objects.claim_spots(event.pk):
+                    EventRegistration.objects.create(event=event, user=request.user)
+                    EventWaitlistEntry.objects.filter(event=event, user=request.user).delete()
+                    event.refresh_from_db(fields=['registered'])
+                    return Response({
+                        'message': 'Successfully registered for event',
+                        'registered': True,
+                        'waitlisted': False,
+                        'current_registrations': event.current_registrations,
+                        'available_spots': event.available_spots
+                    }, status=status.HTTP_201_CREATED)
+        except IntegrityError:
+            return Response(
+                {'error': 'You are already registered for this event'}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if EventRegistration.objects.filter(event=event, user=request.user).exists():
+            return Response(
+                {'error': 'You are already registered for this event'}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            with transaction.atomic():
+                entry = EventWaitlistEntry.objects.create(event=event, user=request.user)
+        except IntegrityError:
+            return Response(
+                {'error': 'You are already on the waitlist for this event'}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response({
+            'message': 'Event is full, you have been added to the waitlist',
+            'registered': False,
+            'waitlisted': True,
+            'position': entry.position
+        }, status=status.HTTP_202_ACCEPTED)
+    
+    elif request.method == 'DELETE':
+        deleted, _ = EventWaitlistEntry.objects.filter(event=event, user=request.user).delete()
+        if not deleted:
+            return Response(
+                {'error': 'You are not on the waitlist for this event'}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response({'message': 'Successfully left the waitlist', 'waitlisted': False})
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -230,7 +540,7 @@ def event_registrations(request, pk):
         )
     
     event = get_object_or_404(Event, pk=pk)
-    registrations = EventRegistration.objects.filter(event=event)
+    registrations = EventRegistration.objects.filter(event=event).select_related('user__profile')
     serializer = EventRegistrationSerializer(registrations, many=True)
     
     return Response({
@@ -240,6 +550,91 @@ def event_registrations(request, pk):
         'registrations': serializer.data
     })
 
+REGISTRATION_EXPORT_COLUMNS = [
+    'id', 'user_id', 'username', 'user_name', 'user_email', 'user_phone', 'user_avatar', 'registered_at'
+]
+
+def registration_export_row(registration):
+    """Export row for a registration loaded with select_related('user__profile')"""
+    user = registration.user
+    profile = getattr(user, 'profile', None)
+    return {
+        'id': registration.id,
+        'user_id': user.id,
+        'username': user.username,
+        'user_name': f"{user.first_name} {user.last_name}" if user.first_name else user.username,
+        'user_email': user.email,
+        'user_phone': profile.get_phone_number() if profile else None,
+        'user_avatar': profile.get_avatar_url() if profile else None,
+        'registered_at': registration.registered_at.isoformat()
+    }
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def export_event_registrations(request, pk):
+    """Stream an event's registrations as CSV (default) or NDJSON (Admin only)"""
+    if not (request.user.is_staff or request.user.is_superuser):
+        return Response(
+            {'error': 'You do not have permission to export event registrations'}, 
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    stream_format = request.query_params.get('stream', 'csv')
+    if stream_format not in ('csv', 'ndjson'):
+        return Response(
+            {'error': 'stream must be one of: csv, ndjson'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    event = get_object_or_404(Event, pk=pk)
+    registrations = (
+        EventRegistration.objects.filter(event=event)
+        .select_related('user__profile')
+        .iterator(chunk_size=STREAM_CHUNK_SIZE)
+    )
+    rows = (registration_export_row(registration) for registration in registrations)
+    
+    if stream_format == 'csv':
+        return streaming_csv_response(rows, REGISTRATION_EXPORT_COLUMNS, f'event-{event.pk}-registrations.csv')
+    return streaming_json_response(rows, 'ndjson')
+
+@api_view(['POST', 'DELETE'])
+@permission_classes([IsAuthenticated])
+def bulk_event_registrations(request, pk):
+    """Register (POST) or remove (DELETE) a list of users for an event (Admin only)"""
+    if not (request.user.is_staff or request.user.is_superuser):
+        return Response(
+            {'error': 'You do not have permission to manage event registrations'}, 
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    event = get_object_or_404(Event, pk=pk)
+    
+    user_ids = request.data.get('user_ids')
+    if not isinstance(user_ids, list) or not all(isinstance(user_id, int) for user_id in user_ids):
+        return Response(
+            {'error': 'user_ids must be a list of user ids'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if len(user_ids) > BULK_REGISTRATION_LIMIT:
+        return Response(
+            {'error': f'At most {BULK_REGISTRATION_LIMIT} users can be processed per request'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    user_ids = list(dict.fromkeys(user_ids))  # Drop duplicates, keep order
+    
+    if request.method == 'POST':
+        results = Event.objects.register_users(event.pk, user_ids)
+    else:
+        results = Event.objects.unregister_users(event.pk, user_ids)
+    
+    event.refresh_from_db(fields=['registered'])
+    return Response({
+        'results': [{'user_id': user_id, 'status': results[user_id]} for user_id in user_ids],
+        'current_registrations': event.current_registrations,
+        'available_spots': event.available_spots
+    })
+
 @api_view(['DELETE'])
 @permission_classes([IsAuthenticated])
 def remove_event_registration(request, pk, user_id):
@@ -253,21 +648,25 @@ def remove_event_registration(request, pk, user_id):
     event = get_object_or_404(Event, pk=pk)
     user = get_object_or_404(User, pk=user_id)
     
-    try:
-        registration = EventRegistration.objects.get(event=event, user=user)
-        registration.delete()
-        
-        return Response({
-            'message': f'Successfully removed {user.username} from event',
-            'current_registrations': event.current_registrations,
-            'available_spots': event.available_spots
-        }, status=status.HTTP_200_OK)
+    with transaction.atomic():
+        deleted, _ = EventRegistration.objects.filter(event=event, user=user).delete()
+        if deleted:
+            Event.objects.release_spots(event.pk)
+            # Hand the freed spot to the head of the waitlist
+            Event.objects.promote_waitlist(event.pk)
     
-    except EventRegistration.DoesNotExist:
+    if not deleted:
         return Response(
             {'error': 'Registration not found'}, 
             status=status.HTTP_404_NOT_FOUND
         )
+    
+    event.refresh_from_db(fields=['registered'])
+    return Response({
+        'message': f'Successfully removed {user.username} from event',
+        'current_registrations': event.current_registrations,
+        'available_spots': event.available_spots
+    }, status=status.HTTP_200_OK)
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -279,21 +678,55 @@ def admin_events_overview(request):
             status=status.HTTP_403_FORBIDDEN
         )
     
-    events = Event.objects.all()
-    events_data = []
-    
-    for event in events:
-        events_data.append({
-            'id': event.id,
-            'title': event.title,
-            'date': event.date,
-            'capacity': event.capacity,
-            'current_registrations': event.current_registrations,
-            'is_full': event.is_full,
-            'registration_percentage': round((event.current_registrations / event.capacity) * 100, 1) if event.capacity > 0 else 0
-        })
+    try:
+        events = filter_events(Event.objects.all(), request.query_params)
+    except ValueError:
+        return Response(
+            {'error': 'start and end must be ISO dates or datetimes'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    # Counts, fullness and percentage all come from one query over the counter columns
+    events = events.with_registration_stats().values(
+        'id', 'title', 'date', 'capacity', 'registered', 'registration_full', 'registration_percentage'
+    )
+    
+    # Paginate only when asked, so the admin panel still gets every event by default
+    next_cursor = None
+    if 'cursor' in request.query_params or 'page_size' in request.query_params:
+        try:
+            events, next_cursor = paginate_keyset(request, events, 'date')
+        except InvalidCursor:
+            return Response({'error': 'Invalid cursor'}, status=status.HTTP_400_BAD_REQUEST)
     
-    return Response(events_data)
+    events_data = [{
+        'id': event['id'],
+        'title': event['title'],
+        'date': event['date'],
+        'capacity': event['capacity'],
+        'current_registrations': event['registered'],
+        'is_full': event['registration_full'],
+        'registration_percentage': round(event['registration_percentage'], 1)
+    } for event in events]
+    
+    return paginated_response(request, events_data, next_cursor)
+
+def user_admin_row(user):
+    """Admin users list entry for a user loaded with select_related('profile')"""
+    profile = UserProfile.for_user(user)
+    return {
+        'id': user.id,
+        'username': user.username,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'email': user.email,
+        'is_staff': user.is_staff,
+        'is_superuser': user.is_superuser,
+        'can_create_content': profile.can_create_content,
+        'avatar_url': profile.get_avatar_url(),
+        'phone_number': profile.get_phone_number(),  # FIXED: Added missing phone_number
+        'date_joined': user.date_joined
+    }
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -304,27 +737,23 @@ def users_list(request):
             status=status.HTTP_403_FORBIDDEN
         )
     
-    users = User.objects.all()
-    users_data = []
-    for user in users:
-        # Ensure user has a profile
-        profile, created = UserProfile.objects.get_or_create(user=user)
-        
-        users_data.append({
-            'id': user.id,
-            'username': user.username,
-            'first_name': user.first_name,
-            'last_name': user.last_name,
-            'email': user.email,
-            'is_staff': user.is_staff,
-            'is_superuser': user.is_superuser,
-            'can_create_content': profile.can_create_content,
-            'avatar_url': profile.get_avatar_url(),
-            'phone_number': profile.get_phone_number(),  # FIXED: Added missing phone_number
-            'date_joined': user.date_joined
-        })
+    stream_format = request.query_params.get('stream')
+    if stream_format and stream_format not in STREAM_FORMATS:
+        return Response(
+            {'error': f'stream must be one of: {", ".join(STREAM_FORMATS)}'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    # Ensure every user has a profile, then load them alongside the users
+    UserProfile.objects.create_missing()
+    users = User.objects.select_related('profile').order_by('id')
+    
+    if stream_format:
+        # Constant memory: rows are fetched and written a chunk at a time
+        rows = (user_admin_row(user) for user in users.iterator(chunk_size=STREAM_CHUNK_SIZE))
+        return streaming_json_response(rows, stream_format)
     
-    return Response(users_data)
+    return Response([user_admin_row(user) for user in users])
 
 @api_view(['PATCH'])
 @permission_classes([IsAuthenticated])
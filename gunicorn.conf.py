@@ -0,0 +1,10 @@
+# Loaded automatically by gunicorn. Set ASGI=True to serve backend.asgi with
+# uvicorn workers, where one process handles many concurrent slow clients;
+# the default stays the sync WSGI worker.
+import os
+
+if os.environ.get('ASGI', 'False') == 'True':
+    wsgi_app = 'backend.asgi:application'
+    worker_class = 'uvicorn.workers.UvicornWorker'
+else:
+    wsgi_app = 'backend.wsgi:application'